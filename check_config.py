@@ -4,34 +4,56 @@
 import os
 import sys
 
+# Example values printed for each missing variable
+EXPORT_HINTS = {
+    "JIRA_BASE_URL": "https://your-domain.atlassian.net/wiki",
+    "JIRA_API_TOKEN": "your-api-key",
+    "JIRA_API_USER": "your-email@example.com",
+}
+
+
+def _mask(value: str) -> str:
+    """Mask all but the first and last four characters of a secret."""
+    n = len(value)
+    return value[:4] + "*" * (n - 8) + value[-4:] if n > 8 else "*" * n
+
 
 def check_config():
-    """Check that all required environment variables are set."""
-    required_vars = ["JIRA_BASE_URL", "JIRA_API_TOKEN", "JIRA_API_USER"]
+    """Check that all required settings are set, under either of their variable names."""
+    sys.path.insert(0, "src")
 
     print("=== Confluence MCP Configuration Check ===")
     print()
 
-    all_set = True
-    for var in required_vars:
-        value = os.getenv(var)
-        if value:
-            if var == "JIRA_API_TOKEN":
+    try:
+        from confluence_mcp.config import _ENV_ALIASES
+    except ValueError as e:
+        # Importing the config loads the settings, which validates JIRA_BASE_URL
+        print(f"✗ Invalid configuration: {e}")
+        return False
+
+    # Snapshot the environment once instead of re-querying it per variable
+    env = dict(os.environ)
+
+    missing = []
+    for field, names in _ENV_ALIASES.items():
+        # Resolve the setting the same way Settings.from_env does: first name set wins
+        var = next((name for name in names if env.get(name)), None)
+        if var is not None:
+            value = env[var]
+            if field == "JIRA_API_TOKEN":
                 # Mask the API key for security
-                masked_value = (
-                    value[:4] + "*" * (len(value) - 8) + value[-4:]
-                    if len(value) > 8
-                    else "*" * len(value)
-                )
-                print(f"✓ {var}: {masked_value}")
+                print(f"✓ {var}: {_mask(value)}")
             else:
                 print(f"✓ {var}: {value}")
         else:
-            print(f"✗ {var}: NOT SET")
-            all_set = False
+            print(f"✗ {' / '.join(names)}: NOT SET")
+            missing.append(field)
+
+    all_set = not missing
 
     # Check optional DEBUG setting
-    debug = os.getenv("DEBUG", "False")
+    debug = env.get("DEBUG", "False")
     print(f"  DEBUG: {debug}")
 
     print()
@@ -39,29 +61,18 @@ def check_config():
     if all_set:
         print("✓ All required environment variables are set!")
 
-        # Test URL format
-        confluence_url = os.getenv("JIRA_BASE_URL")
-        if not confluence_url.startswith(("http://", "https://")):
-            print(f"⚠️  Warning: JIRA_BASE_URL should start with http:// or https://")
-            print(f"   Current value: {confluence_url}")
-            all_set = False
-
-        if confluence_url.endswith("/"):
-            print(f"⚠️  Note: JIRA_BASE_URL should not end with '/' (it will be stripped)")
+        # Test URL format (the scheme is already validated when the config is loaded)
+        url_var = next(name for name in _ENV_ALIASES["JIRA_BASE_URL"] if env.get(name))
+        if env[url_var].endswith("/"):
+            print(f"⚠️  Note: {url_var} should not end with '/' (it will be stripped)")
 
     else:
         print("✗ Missing required environment variables!")
         print()
         print("To fix this, add these lines to your ~/.zshrc or ~/.bashrc:")
         print()
-        for var in required_vars:
-            if not os.getenv(var):
-                if var == "JIRA_BASE_URL":
-                    print(f"export {var}=https://your-domain.atlassian.net/wiki")
-                elif var == "JIRA_API_TOKEN":
-                    print(f"export {var}=your-api-key")
-                elif var == "JIRA_API_USER":
-                    print(f"export {var}=your-email@example.com")
+        for var in missing:
+            print(f"export {var}={EXPORT_HINTS[var]}")
 
         print()
         print("Then run: source ~/.zshrc")
@@ -1,10 +1,15 @@
 """Confluence API client."""
 
 import httpx
+import orjson
 import asyncio
+import base64
+import importlib.util
 import logging
-from typing import Any, Dict, List, Optional, Union, Callable
-from functools import wraps
+import random
+import time
+from typing import Any, Awaitable, Dict, List, Optional, Set, Tuple, Type, Union, Callable
+from functools import lru_cache, partial, wraps
 
 from .config import settings
 from .models import ConfluenceError
@@ -12,26 +17,198 @@ from .models import ConfluenceError
 # Set up logging
 logger = logging.getLogger("confluence_mcp.api_client")
 
+# Page size used by fetch_all_pages when the caller does not set one, and the
+# largest page size Confluence Cloud accepts on its paginated endpoints
+DEFAULT_PAGE_LIMIT = 200
+MAX_PAGE_LIMIT = 250
+
+# Largest window of pages fetch_all_pages requests ahead when the total is unknown;
+# at most this many minus one requests are wasted past the last page
+MAX_SPECULATIVE_PAGES = 4
+
+# HTTP/2 support requires the optional h2 package (installed via httpx[http2])
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# Request bodies are serialized with orjson, so the content type is set explicitly
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+# Errors raised before a request reached the server, so even a non-idempotent request
+# can be sent again without the risk of applying it twice
+UNSENT_REQUEST_ERRORS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+# Default connection pool and timeouts: fail fast on connect, keep idle connections
+# around long enough to be reused between tool calls
+DEFAULT_LIMITS = httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60)
+DEFAULT_TIMEOUT = httpx.Timeout(30.0, connect=5.0)
+
+# Shared client instance so every tool call reuses the same connection pool, and the
+# event loop it was created on (its pooled connections cannot be used from another loop)
+_client: Optional["ConfluenceApiClient"] = None
+_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+# Closes of clients replaced after an event loop change that are still in progress
+_closing: Set[asyncio.Task] = set()
+
+
+def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+    """Return the running event loop, or None when called outside of one."""
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+async def _close_quietly(client: "ConfluenceApiClient"):
+    """Close a client, logging rather than raising if its connections are unusable."""
+    try:
+        await client.close()
+    except Exception as e:
+        logger.debug(f"Error closing client from a previous event loop: {e}")
+
+
+def _discard_client(client: "ConfluenceApiClient", client_loop: asyncio.AbstractEventLoop):
+    """Close a client that was created on another event loop without waiting for it.
+
+    If that loop is still running (in another thread) the client is closed there;
+    otherwise it is closed in the background on the current loop.
+
+    Args:
+        client: The client being replaced
+        client_loop: The event loop it was created on
+    """
+    if client_loop.is_running():
+        asyncio.run_coroutine_threadsafe(_close_quietly(client), client_loop)
+        return
+    task = asyncio.get_running_loop().create_task(_close_quietly(client))
+    _closing.add(task)
+    task.add_done_callback(_closing.discard)
+
+
+async def _gather_or_cancel(aws) -> List[Any]:
+    """Run awaitables concurrently, cancelling the rest as soon as one fails.
+
+    Unlike a plain asyncio.gather, requests that have not finished yet are not left
+    running after the first error; unlike asyncio.TaskGroup, the original exception
+    is raised rather than an ExceptionGroup.
+
+    Args:
+        aws: Awaitables to run
+
+    Returns:
+        Their results, in order
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        raise
+
 
 def get_client() -> "ConfluenceApiClient":
-    """Get a configured API client instance.
+    """Get the shared API client instance.
+
+    The client is created on first use (or after it has been closed, or when called
+    from a different event loop) and reused afterwards so that keep-alive connections
+    are shared across requests.
 
     Returns:
-        ConfluenceApiClient: A new client instance
+        ConfluenceApiClient: The shared client instance
     """
-    return ConfluenceApiClient(
-        base_url=settings.JIRA_BASE_URL,
-        api_key=settings.JIRA_API_TOKEN,
-        user_email=settings.JIRA_API_USER,
+    global _client, _client_loop
+    loop = _running_loop()
+
+    # Fast path for the common case: every tool call on the server's loop
+    if _client is not None and _client_loop is loop and not _client.client.is_closed:
+        return _client
+
+    if _client is not None and _client_loop is not None and loop not in (None, _client_loop):
+        # Connections pooled on another (possibly closed) loop cannot be reused here
+        if not _client.client.is_closed:
+            _discard_client(_client, _client_loop)
+        _client = None
+    if _client is None or _client.client.is_closed:
+        _client = ConfluenceApiClient(
+            base_url=settings.JIRA_BASE_URL,
+            api_key=settings.JIRA_API_TOKEN,
+            user_email=settings.JIRA_API_USER,
+            cache_ttl=settings.CACHE_TTL,
+        )
+        _client_loop = None
+    if _client_loop is None:
+        _client_loop = loop
+    return _client
+
+
+async def close_client():
+    """Close the shared API client, if one has been created.
+
+    Also waits for clients replaced after an event loop change to finish closing.
+    """
+    global _client, _client_loop
+    loop = asyncio.get_running_loop()
+    pending = [task for task in _closing if task.get_loop() is loop]
+    if pending:
+        await asyncio.gather(*pending)
+    if _client is not None:
+        await _client.close()
+        _client = None
+        _client_loop = None
+
+
+def _cache_key(path: str, params: Optional[Dict[str, Any]]) -> tuple:
+    """Build a hashable cache key for a GET request.
+
+    List and tuple parameter values (which httpx sends as repeated query
+    parameters) are converted to tuples so that they can be hashed.
+
+    Args:
+        path: API endpoint path
+        params: Query parameters
+
+    Returns:
+        Tuple of the path and the sorted parameters
+    """
+    items = (
+        (name, tuple(value) if isinstance(value, (list, tuple)) else value)
+        for name, value in (params or {}).items()
     )
+    return (path, tuple(sorted(items)))
+
 
+@lru_cache(maxsize=8)
+def _basic_auth_header(user_email: str, api_key: str) -> str:
+    """Generate the Basic Auth header value from email and API key.
 
-def retry_on_connection_error(max_retries: int = 3, retry_delay: float = 1.0):
+    Args:
+        user_email: User email for authentication
+        api_key: Confluence API key
+
+    Returns:
+        Authorization header value ("Basic " followed by the base64 credentials)
+    """
+    return "Basic " + base64.b64encode(f"{user_email}:{api_key}".encode()).decode()
+
+
+def retry_on_connection_error(
+    max_retries: int = 3,
+    retry_delay: float = 1.0,
+    max_delay: float = 10.0,
+    retry_on: Tuple[Type[Exception], ...] = (httpx.RequestError,),
+):
     """Retry decorator for connection errors.
 
+    Delays grow exponentially from ``retry_delay`` up to ``max_delay``, and each
+    sleep is drawn uniformly from [0, delay] ("full jitter") so that concurrent
+    callers do not retry in lockstep.
+
     Args:
         max_retries: Maximum number of retry attempts
-        retry_delay: Delay between retries in seconds
+        retry_delay: Base delay between retries in seconds
+        max_delay: Upper bound on the delay between retries in seconds
+        retry_on: Exception types that trigger a retry
 
     Returns:
         Decorated function
@@ -44,20 +221,21 @@ def retry_on_connection_error(max_retries: int = 3, retry_delay: float = 1.0):
             while True:
                 try:
                     return await func(*args, **kwargs)
-                except httpx.RequestError as e:
+                except retry_on as e:
                     retries += 1
                     if retries > max_retries:
                         # If we've exhausted our retries, raise the error
-                        logger.error(f"Failed after {max_retries} retries: {str(e)}")
+                        logger.error("Failed after %s retries: %s", max_retries, e)
                         raise
 
                     # Log the retry attempt
                     logger.warning(
-                        f"Connection error, retrying ({retries}/{max_retries}): {str(e)}"
+                        "Connection error, retrying (%s/%s): %s", retries, max_retries, e
                     )
 
-                    # Wait before retrying with exponential backoff
-                    await asyncio.sleep(retry_delay * (2 ** (retries - 1)))
+                    # Wait before retrying with capped, jittered exponential backoff
+                    delay = min(max_delay, retry_delay * (2 ** (retries - 1)))
+                    await asyncio.sleep(random.uniform(0, delay))
 
         return wrapper
 
@@ -72,8 +250,11 @@ class ConfluenceApiClient:
         base_url: str = None,
         api_key: str = None,
         user_email: str = None,
-        timeout: float = 30.0,
+        timeout: Union[float, httpx.Timeout] = DEFAULT_TIMEOUT,
         limits: httpx.Limits = None,
+        http2: bool = True,
+        cache_ttl: float = 30.0,
+        cache_maxsize: int = 256,
     ):
         """Initialize the API client.
 
@@ -81,8 +262,11 @@ class ConfluenceApiClient:
             base_url: Confluence base URL (defaults to value from settings)
             api_key: Confluence API key (defaults to value from settings)
             user_email: User email for authentication (defaults to value from settings)
-            timeout: Request timeout in seconds
+            timeout: Request timeout in seconds, or an httpx.Timeout
             limits: Connection pool limits for httpx
+            http2: Whether to negotiate HTTP/2 (ignored if h2 is not installed)
+            cache_ttl: Seconds to reuse GET responses for (0 disables caching)
+            cache_maxsize: Maximum number of cached GET responses
         """
         self.base_url = base_url or settings.JIRA_BASE_URL
         self.api_key = api_key or settings.JIRA_API_TOKEN
@@ -117,40 +301,85 @@ class ConfluenceApiClient:
         self.base_url = self.base_url.rstrip("/")
         if self.base_url.endswith("/wiki"):
             self.base_url = self.base_url[:-5]  # Remove /wiki
-            logger.debug(f"Removed /wiki from base URL, now: {self.base_url}")
+            logger.debug("Removed /wiki from base URL, now: %s", self.base_url)
 
         # Use Confluence Cloud REST API v1 (more stable and widely supported)
         # v2 API is newer but has different endpoint structures and may not support all operations
         self.api_url = f"{self.base_url}/wiki/rest/api"
+        self._api_prefix = self.api_url + "/"
 
-        # Set up authentication headers
+        # Set up authentication headers (Content-Type is sent with request bodies only)
         self.headers = {
-            "Authorization": f"Basic {self._get_basic_auth_token()}",
+            "Authorization": _basic_auth_header(self.user_email, self.api_key),
             "Accept": "application/json",
-            "Content-Type": "application/json",
         }
 
         # Connection limits for optimal performance
-        self.limits = limits or httpx.Limits(max_connections=10, max_keepalive_connections=5)
+        self.limits = limits or DEFAULT_LIMITS
+
+        # HTTP/2 multiplexes concurrent requests over a single connection
+        self.http2 = http2 and HTTP2_AVAILABLE
 
         # Initialize HTTP client with timeout and connection pooling
-        self.client = httpx.AsyncClient(headers=self.headers, timeout=timeout, limits=self.limits)
+        self.client = httpx.AsyncClient(
+            headers=self.headers, timeout=timeout, limits=self.limits, http2=self.http2
+        )
+
+        # In-process cache of GET responses keyed by (path, params)
+        self.cache_ttl = cache_ttl
+        self.cache_maxsize = cache_maxsize
+        self._cache: Dict[tuple, tuple] = {}
+
+        # GET requests currently on the wire, so identical concurrent calls share one,
+        # and how many callers are waiting on each of them
+        self._inflight: Dict[tuple, asyncio.Task] = {}
+        self._waiters: Dict[asyncio.Task, int] = {}
 
-        logger.info(f"Initialized Confluence API client for {self.base_url}")
-        logger.debug(f"API URL: {self.api_url}")
-        logger.debug(f"User email: {self.user_email}")
-        logger.debug(f"API key configured: {'Yes' if self.api_key else 'No'}")
+        logger.info("Initialized Confluence API client for %s", self.base_url)
+        logger.debug("API URL: %s", self.api_url)
+        logger.debug("User email: %s", self.user_email)
+        logger.debug("API key configured: %s", "Yes" if self.api_key else "No")
 
-    def _get_basic_auth_token(self) -> str:
-        """Generate Basic Auth token from email and API key.
+    def _url(self, path: str) -> str:
+        """Build the full request URL for an API path.
+
+        Args:
+            path: API endpoint path, with or without a leading slash
 
         Returns:
-            Base64 encoded auth token
+            Absolute request URL
         """
-        import base64
+        return self._api_prefix + (path[1:] if path.startswith("/") else path)
+
+    def _store(self, key: tuple, data: Dict[str, Any]):
+        """Cache a GET response, evicting the oldest entry when full."""
+        self._cache.pop(key, None)
+        if len(self._cache) >= self.cache_maxsize:
+            self._cache.pop(next(iter(self._cache)))
+        self._cache[key] = (time.monotonic(), data)
 
-        auth_str = f"{self.user_email}:{self.api_key}"
-        return base64.b64encode(auth_str.encode()).decode()
+    def invalidate(self, path_prefix: Optional[str] = None):
+        """Evict cached GET responses.
+
+        Args:
+            path_prefix: Only evict paths starting with this prefix (None for all)
+        """
+        if path_prefix is None:
+            self._cache.clear()
+            self._inflight.clear()
+            return
+
+        path_prefix = path_prefix.lstrip("/")
+        for key in [k for k in self._cache if k[0].lstrip("/").startswith(path_prefix)]:
+            del self._cache[key]
+        for key in [k for k in self._inflight if k[0].lstrip("/").startswith(path_prefix)]:
+            del self._inflight[key]
+
+    def _invalidate_for(self, path: str):
+        """Evict cached responses that a write to the given path may have changed."""
+        # Writes affect the resource collection (e.g. content/...) and search results
+        self.invalidate(path.lstrip("/").split("/", 1)[0])
+        self.invalidate("search")
 
     async def close(self):
         """Close the HTTP client."""
@@ -158,6 +387,43 @@ class ConfluenceApiClient:
         logger.debug("Closed HTTP client")
 
     @retry_on_connection_error()
+    async def _send(
+        self, send: Callable[..., Awaitable[httpx.Response]], url: str, **kwargs
+    ) -> httpx.Response:
+        """Send an idempotent request, retrying it on any connection error.
+
+        Kept separate from the public request methods so that the retries happen
+        before httpx.RequestError is translated into a ConfluenceError.
+
+        Args:
+            send: httpx client method to call (e.g. self.client.get)
+            url: Request URL
+            **kwargs: Keyword arguments for the httpx method
+
+        Returns:
+            The HTTP response
+        """
+        return await send(url, **kwargs)
+
+    @retry_on_connection_error(retry_on=UNSENT_REQUEST_ERRORS)
+    async def _send_once(
+        self, send: Callable[..., Awaitable[httpx.Response]], url: str, **kwargs
+    ) -> httpx.Response:
+        """Send a non-idempotent request, retrying it only if it never reached the server.
+
+        Errors such as read timeouts may arrive after the server has already acted on
+        the request (e.g. created a page), so those are not retried.
+
+        Args:
+            send: httpx client method to call (e.g. self.client.post)
+            url: Request URL
+            **kwargs: Keyword arguments for the httpx method
+
+        Returns:
+            The HTTP response
+        """
+        return await send(url, **kwargs)
+
     async def get(self, path: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """Make a GET request to the Confluence API.
 
@@ -165,27 +431,84 @@ class ConfluenceApiClient:
             path: API endpoint path
             params: Query parameters
 
+        Returns:
+            Response data as dictionary. Cached and concurrently joined requests
+            return the same object to every caller, so treat it as read-only.
+
+        Raises:
+            ConfluenceError: If the API returns an error
+        """
+        key = _cache_key(path, params)
+        if self.cache_ttl > 0:
+            cached = self._cache.get(key)
+            if cached and time.monotonic() - cached[0] < self.cache_ttl:
+                logger.debug("GET %s served from cache", path)
+                return cached[1]
+
+        # Join an identical request that is already in flight instead of sending another
+        request = self._inflight.get(key)
+        if request is None:
+            request = asyncio.ensure_future(self._fetch(key, path, params))
+            self._inflight[key] = request
+            request.add_done_callback(partial(self._forget_inflight, key))
+        else:
+            logger.debug("GET %s joined an in-flight request", path)
+
+        # Shield the shared request so one caller being cancelled does not cancel it for
+        # the others; once the last waiter is gone, the request itself is cancelled
+        self._waiters[request] = self._waiters.get(request, 0) + 1
+        try:
+            return await asyncio.shield(request)
+        finally:
+            remaining = self._waiters.pop(request) - 1
+            if remaining:
+                self._waiters[request] = remaining
+            elif not request.done():
+                request.cancel()
+
+    def _forget_inflight(self, key: tuple, request: asyncio.Task):
+        """Drop a finished GET from the in-flight map, unless it was already replaced."""
+        if self._inflight.get(key) is request:
+            del self._inflight[key]
+
+    async def _fetch(
+        self, key: tuple, path: str, params: Optional[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """Send a GET request and cache the response.
+
+        Args:
+            key: Cache key for the request
+            path: API endpoint path
+            params: Query parameters
+
         Returns:
             Response data as dictionary
 
         Raises:
             ConfluenceError: If the API returns an error
         """
-        url = f"{self.api_url}/{path.lstrip('/')}"
-        logger.debug(f"GET {url} with params: {params}")
+        url = self._url(path)
+        logger.debug("GET %s with params: %s", url, params)
 
         try:
-            response = await self.client.get(url, params=params)
-            return self._process_response(response)
+            response = await self._send(self.client.get, url, params=params)
+            data = self._process_response(response)
+            # Skip caching if a write invalidated this request while it was in flight
+            if (
+                self.cache_ttl > 0
+                and "no-store" not in response.headers.get("cache-control", "")
+                and self._inflight.get(key) is asyncio.current_task()
+            ):
+                self._store(key, data)
+            return data
         except httpx.RequestError as e:
-            logger.error(f"Network error during GET request: {str(e)}")
+            logger.error("Network error during GET request: %s", e)
             raise ConfluenceError(
                 message=f"Network error during GET request: {str(e)}",
                 status_code=0,
-                detailed_message=f"URL: {url}",
+                url=url,
             )
 
-    @retry_on_connection_error()
     async def post(self, path: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Make a POST request to the Confluence API.
 
@@ -199,21 +522,23 @@ class ConfluenceApiClient:
         Raises:
             ConfluenceError: If the API returns an error
         """
-        url = f"{self.api_url}/{path.lstrip('/')}"
-        logger.debug(f"POST {url} with data: {data}")
+        url = self._url(path)
+        logger.debug("POST %s with data: %s", url, data)
 
         try:
-            response = await self.client.post(url, json=data)
+            response = await self._send_once(
+                self.client.post, url, content=orjson.dumps(data), headers=_JSON_HEADERS
+            )
+            self._invalidate_for(path)
             return self._process_response(response)
         except httpx.RequestError as e:
-            logger.error(f"Network error during POST request: {str(e)}")
+            logger.error("Network error during POST request: %s", e)
             raise ConfluenceError(
                 message=f"Network error during POST request: {str(e)}",
                 status_code=0,
-                detailed_message=f"URL: {url}",
+                url=url,
             )
 
-    @retry_on_connection_error()
     async def put(self, path: str, data: Dict[str, Any]) -> Dict[str, Any]:
         """Make a PUT request to the Confluence API.
 
@@ -227,21 +552,23 @@ class ConfluenceApiClient:
         Raises:
             ConfluenceError: If the API returns an error
         """
-        url = f"{self.api_url}/{path.lstrip('/')}"
-        logger.debug(f"PUT {url} with data: {data}")
+        url = self._url(path)
+        logger.debug("PUT %s with data: %s", url, data)
 
         try:
-            response = await self.client.put(url, json=data)
+            response = await self._send(
+                self.client.put, url, content=orjson.dumps(data), headers=_JSON_HEADERS
+            )
+            self._invalidate_for(path)
             return self._process_response(response)
         except httpx.RequestError as e:
-            logger.error(f"Network error during PUT request: {str(e)}")
+            logger.error("Network error during PUT request: %s", e)
             raise ConfluenceError(
                 message=f"Network error during PUT request: {str(e)}",
                 status_code=0,
-                detailed_message=f"URL: {url}",
+                url=url,
             )
 
-    @retry_on_connection_error()
     async def delete(self, path: str) -> Dict[str, Any]:
         """Make a DELETE request to the Confluence API.
 
@@ -254,18 +581,19 @@ class ConfluenceApiClient:
         Raises:
             ConfluenceError: If the API returns an error
         """
-        url = f"{self.api_url}/{path.lstrip('/')}"
-        logger.debug(f"DELETE {url}")
+        url = self._url(path)
+        logger.debug("DELETE %s", url)
 
         try:
-            response = await self.client.delete(url)
+            response = await self._send(self.client.delete, url)
+            self._invalidate_for(path)
             return self._process_response(response)
         except httpx.RequestError as e:
-            logger.error(f"Network error during DELETE request: {str(e)}")
+            logger.error("Network error during DELETE request: %s", e)
             raise ConfluenceError(
                 message=f"Network error during DELETE request: {str(e)}",
                 status_code=0,
-                detailed_message=f"URL: {url}",
+                url=url,
             )
 
     def _process_response(self, response: httpx.Response) -> Dict[str, Any]:
@@ -280,18 +608,28 @@ class ConfluenceApiClient:
         Raises:
             ConfluenceError: If the API returns an error
         """
+        # Nothing to parse for empty responses (e.g. 204 from DELETE)
+        if response.status_code == 204 or (
+            response.status_code < 400 and response.headers.get("content-length") == "0"
+        ):
+            return {}
+
         if response.status_code >= 400:
-            try:
-                error_data = response.json() if response.content else {"message": "Unknown error"}
-            except Exception:
-                error_data = {"message": "Failed to parse error response"}
+            # Only parse bodies that may be JSON; HTML error pages fall back to defaults
+            content_type = response.headers.get("content-type", "")
+            error_data = {}
+            if (not content_type or "json" in content_type) and response.content:
+                try:
+                    error_data = orjson.loads(response.content)
+                except Exception:
+                    error_data = {}
 
-            error_message = error_data.get("message", "API request failed")
+            error_message = error_data.get("message")
             detailed_message = error_data.get("details", None)
 
             # Log the error for debugging
             logger.error(
-                f"API error ({response.status_code}): {error_message} - {detailed_message}"
+                "API error (%s): %s - %s", response.status_code, error_message, detailed_message
             )
 
             # Use the API-provided message for specific error handling in tests
@@ -319,9 +657,9 @@ class ConfluenceApiClient:
 
         if response.content:
             try:
-                return response.json()
+                return orjson.loads(response.content)
             except Exception as e:
-                logger.error(f"Failed to parse JSON response: {str(e)}")
+                logger.error("Failed to parse JSON response: %s", e)
                 raise ConfluenceError(
                     message=f"Failed to parse JSON response: {str(e)}",
                     status_code=response.status_code,
@@ -330,52 +668,111 @@ class ConfluenceApiClient:
         return {}
 
     async def fetch_all_pages(
-        self, path: str, params: Optional[Dict[str, Any]] = None, max_pages: Optional[int] = None
+        self,
+        path: str,
+        params: Optional[Dict[str, Any]] = None,
+        max_pages: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        known_total: bool = False,
     ) -> List[Dict[str, Any]]:
         """Fetch all pages of results for paginated endpoints.
 
+        When the first response reports the total result count (``totalSize``),
+        the remaining pages are requested concurrently. Otherwise pages are
+        fetched ahead in windows that double in size up to MAX_SPECULATIVE_PAGES
+        (or ``concurrency``, if lower), stopping at the first short page; pages
+        requested past the end are wasted, at most MAX_SPECULATIVE_PAGES - 1 of
+        them. If any page fails, requests still in flight are cancelled and the
+        error is raised.
+
+        With ``known_total``, the caller guarantees that at least ``max_pages``
+        pages exist, so all of them are requested at once without probing the
+        first page.
+
+        Pages hold DEFAULT_PAGE_LIMIT results unless ``params`` sets ``limit``;
+        larger limits are capped at MAX_PAGE_LIMIT.
+
         Args:
             path: API endpoint path
             params: Query parameters
             max_pages: Maximum number of pages to fetch (None for all)
+            concurrency: Maximum number of pages in flight (defaults to the pool size)
+            known_total: Whether ``max_pages`` pages are known to exist
 
         Returns:
             List of all results combined
         """
-        if params is None:
-            params = {}
-
-        # Initialize result list and pagination variables
-        all_results = []
-        page_num = 1
+        params = dict(params or {})
 
         # Set initial parameters
         params["start"] = params.get("start", 0)
-        params["limit"] = params.get("limit", 25)
-
-        while True:
-            # Make request for current page
-            response = await self.get(path, params)
-
-            # Extract results and add to collection
-            results = response.get("results", [])
-            all_results.extend(results)
-
-            # Check if we've reached the end of pagination
-            if not response.get("_links", {}).get("next") or len(results) < params["limit"]:
-                break
-
-            # Check if we've reached max_pages
-            if max_pages and page_num >= max_pages:
-                logger.info(f"Reached maximum page limit ({max_pages})")
-                break
-
-            # Update start parameter for next page
-            params["start"] += params["limit"]
-            page_num += 1
-
-            # Log pagination progress
-            logger.debug(f"Fetching page {page_num} for {path}")
+        params["limit"] = min(params.get("limit", DEFAULT_PAGE_LIMIT), MAX_PAGE_LIMIT)
+        start, limit = params["start"], params["limit"]
+        concurrency = concurrency or self.limits.max_connections or 10
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch_page(offset: int) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.get(path, {**params, "start": offset})
+
+        if known_total and max_pages:
+            # Every offset is known up front, so skip the probe of the first page
+            offsets = [start + i * limit for i in range(max_pages)]
+            pages = await _gather_or_cancel(fetch_page(offset) for offset in offsets)
+            all_results = [result for page in pages for result in page.get("results", [])]
+            logger.info("Fetched %s results from %s pages", len(all_results), max_pages)
+            return all_results
+
+        # Fetch the first page to discover whether more results exist
+        response = await self.get(path, params)
+        results = response.get("results", [])
+        all_results = list(results)
+        page_num = 1
 
-        logger.info(f"Fetched {len(all_results)} results from {page_num} pages")
+        # A short page means there is nothing more to fetch
+        if len(results) < limit:
+            logger.info("Fetched %s results from %s pages", len(all_results), page_num)
+            return all_results
+
+        total = response.get("totalSize")
+        if total is not None:
+            # Total is known, so request every remaining offset at once
+            offsets = list(range(start + limit, total, limit))
+            if max_pages:
+                offsets = offsets[: max(max_pages - 1, 0)]
+
+            logger.debug("Fetching %s remaining pages for %s concurrently", len(offsets), path)
+            for page in await _gather_or_cancel(fetch_page(offset) for offset in offsets):
+                all_results.extend(page.get("results", []))
+            page_num += len(offsets)
+        else:
+            # Total is unknown, so speculatively fetch growing windows of pages
+            offset = start + limit
+            window = 1
+            done = False
+            while not done:
+                size = window
+                if max_pages:
+                    size = min(size, max_pages - page_num)
+                    if size <= 0:
+                        logger.info("Reached maximum page limit (%s)", max_pages)
+                        break
+
+                offsets = [offset + i * limit for i in range(size)]
+                logger.debug("Fetching pages %s-%s for %s", page_num + 1, page_num + size, path)
+
+                for page in await _gather_or_cancel(fetch_page(o) for o in offsets):
+                    results = page.get("results", [])
+                    all_results.extend(results)
+                    page_num += 1
+
+                    # Check if we've reached the end of pagination
+                    if len(results) < limit:
+                        done = True
+                        break
+
+                offset += size * limit
+                window = min(window * 2, concurrency, MAX_SPECULATIVE_PAGES)
+
+        logger.info("Fetched %s results from %s pages", len(all_results), page_num)
         return all_results
@@ -1,13 +1,42 @@
 """Configuration settings for the Confluence MCP server."""
 
-from pydantic_settings import BaseSettings
-from pydantic import field_validator, ConfigDict
+import os
+from dataclasses import dataclass
+from typing import Dict, Mapping, Optional
 
+_TRUE_VALUES = ("1", "true", "yes", "on")
+
+# URL prefixes accepted for the Confluence base URL
+_URL_SCHEMES = ("http://", "https://")
+
+# Alternative variable names accepted for each credential setting
+_ENV_ALIASES = {
+    "JIRA_BASE_URL": ("JIRA_BASE_URL", "CONFLUENCE_URL"),
+    "JIRA_API_TOKEN": ("JIRA_API_TOKEN", "CONFLUENCE_API_KEY"),
+    "JIRA_API_USER": ("JIRA_API_USER", "CONFLUENCE_USER_EMAIL"),
+}
+
+
+def _read_env_file(path: str = ".env") -> Dict[str, str]:
+    """Read variables from a dotenv file, if one exists.
+
+    Args:
+        path: Path to the dotenv file
+
+    Returns:
+        Mapping of variable names to values (empty if the file is missing)
+    """
+    if not os.path.isfile(path):
+        return {}
+
+    from dotenv import dotenv_values
+
+    return {key: value for key, value in dotenv_values(path, encoding="utf-8").items() if value}
 
-class Settings(BaseSettings):
-    """Configuration settings."""
 
-    model_config = ConfigDict(extra="ignore")
+@dataclass(frozen=True, slots=True)
+class Settings:
+    """Configuration settings."""
 
     # Confluence API settings
     JIRA_BASE_URL: str = ""
@@ -19,18 +48,57 @@ class Settings(BaseSettings):
     PORT: int = 3846
     DEBUG: bool = False
 
-    @field_validator("JIRA_BASE_URL")
-    def validate_confluence_url(cls, v: str) -> str:
-        """Validate and normalize the Confluence URL."""
-        if not v:  # Allow empty string for testing
-            return v
+    # Emit log records as JSON lines instead of plain text
+    LOG_JSON: bool = False
+
+    # Seconds to reuse GET responses for (0 disables the response cache)
+    CACHE_TTL: float = 30.0
+
+    @classmethod
+    def from_env(
+        cls, environ: Optional[Mapping[str, str]] = None, env_file: str = ".env"
+    ) -> "Settings":
+        """Build settings from the environment.
+
+        Values from the process environment take precedence over the dotenv file.
+        The CONFLUENCE_URL, CONFLUENCE_API_KEY and CONFLUENCE_USER_EMAIL names are
+        accepted as fallbacks for their JIRA_* counterparts.
+
+        Args:
+            environ: Environment mapping (defaults to os.environ)
+            env_file: Path to an optional dotenv file
+
+        Returns:
+            Settings: The loaded settings
+        """
+        env = {**_read_env_file(env_file), **(os.environ if environ is None else environ)}
+
+        values = {
+            field: next((env[name] for name in names if env.get(name)), "")
+            for field, names in _ENV_ALIASES.items()
+        }
+        values["JIRA_BASE_URL"] = validate_confluence_url(values["JIRA_BASE_URL"])
+        values["DEBUG"] = env.get("DEBUG", "").strip().lower() in _TRUE_VALUES
+        values["LOG_JSON"] = env.get("LOG_JSON", "").strip().lower() in _TRUE_VALUES
+        if "HOST" in env:
+            values["HOST"] = env["HOST"]
+        if "PORT" in env:
+            values["PORT"] = int(env["PORT"])
+        if "CACHE_TTL" in env:
+            values["CACHE_TTL"] = float(env["CACHE_TTL"])
+
+        return cls(**values)
+
 
-        v = v.rstrip("/")
-        if not v.startswith(("http://", "https://")):
-            raise ValueError("JIRA_BASE_URL must start with http:// or https://")
+def validate_confluence_url(v: str) -> str:
+    """Validate and normalize the Confluence URL."""
+    if not v:  # Allow empty string for testing
         return v
 
-    model_config = {"env_file": ".env", "env_file_encoding": "utf-8", "case_sensitive": True}
+    v = v.rstrip("/")
+    if not v.startswith(_URL_SCHEMES):
+        raise ValueError("JIRA_BASE_URL must start with http:// or https://")
+    return v
 
 
-settings = Settings()
+settings = Settings.from_env()
@@ -0,0 +1,66 @@
+"""Server-side pagination cursors for resuming paginated listings."""
+
+import secrets
+import time
+from typing import Any, Dict, Optional
+
+
+class CursorStore:
+    """Bounded store of pagination state keyed by opaque tokens.
+
+    Each entry records the API ``next`` link of a partially read listing, so a later
+    call can fetch the following page without re-sending the original parameters.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float = 300.0):
+        """Initialize the store.
+
+        Args:
+            maxsize: Maximum number of cursors kept (the oldest are evicted first)
+            ttl: Seconds a cursor stays valid after it was created
+        """
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: Dict[str, tuple] = {}
+
+    def put(self, endpoint: str, next_link: str, params: Dict[str, Any]) -> str:
+        """Store pagination state and return its token.
+
+        Args:
+            endpoint: API endpoint the listing was read from
+            next_link: API link to the next page of results
+            params: Parameters of the original request
+
+        Returns:
+            Opaque cursor token
+        """
+        if len(self._entries) >= self.maxsize:
+            self._entries.pop(next(iter(self._entries)))
+
+        token = secrets.token_urlsafe(16)
+        self._entries[token] = (
+            time.monotonic(),
+            {"endpoint": endpoint, "next_link": next_link, "params": params},
+        )
+        return token
+
+    def get(self, token: str) -> Optional[Dict[str, Any]]:
+        """Look up the pagination state for a token.
+
+        Args:
+            token: Cursor token returned by put
+
+        Returns:
+            The stored state, or None if the token is unknown or has expired
+        """
+        entry = self._entries.get(token)
+        if entry is None:
+            return None
+        if time.monotonic() - entry[0] >= self.ttl:
+            del self._entries[token]
+            return None
+        return entry[1]
+
+
+# Shared cursor store used by the listing tools
+cursors = CursorStore()
@@ -1,17 +1,50 @@
 """Confluence MCP functions package."""
 
-from .space import list_spaces, get_space
-from .page import list_pages, get_page, create_page, update_page, delete_page
-from .search import search_content, advanced_search
+import importlib
+
+# Submodules are imported on first attribute access so callers only pay for what they use
+_LAZY = {
+    "list_spaces": ".space",
+    "get_space": ".space",
+    "list_pages": ".page",
+    "continue_pagination": ".page",
+    "get_page": ".page",
+    "create_page": ".page",
+    "update_page": ".page",
+    "delete_page": ".page",
+    "create_pages": ".page",
+    "update_pages": ".page",
+    "delete_pages": ".page",
+    "search_content": ".search",
+    "advanced_search": ".search",
+}
 
 __all__ = [
     "list_spaces",
     "get_space",
     "list_pages",
+    "continue_pagination",
     "get_page",
     "create_page",
     "update_page",
     "delete_page",
+    "create_pages",
+    "update_pages",
+    "delete_pages",
     "search_content",
     "advanced_search",
 ]
+
+
+def __getattr__(name):
+    if name not in _LAZY:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module = importlib.import_module(_LAZY[name], __name__)
+    attr = getattr(module, name)
+    globals()[name] = attr
+    return attr
+
+
+def __dir__():
+    return sorted(list(globals()) + list(_LAZY))
@@ -0,0 +1,41 @@
+"""Shared error handling for MCP function implementations."""
+
+import inspect
+import logging
+from functools import wraps
+
+
+def handled(op: str):
+    """Log failures of an implementation function before re-raising them.
+
+    The exception is re-raised unchanged so FastMCP can report it to the client; the
+    call arguments are only formatted when an error is actually logged.
+
+    Args:
+        op: Description of the operation for the log message (e.g. "listing pages")
+
+    Returns:
+        Decorator for async implementation functions
+    """
+
+    def decorator(func):
+        # Log under the same name as the module's own logger
+        logger = logging.getLogger(f"confluence_mcp.functions.{func.__module__.rpartition('.')[2]}")
+        signature = inspect.signature(func)
+
+        @wraps(func)
+        async def wrapper(*args, **kwargs):
+            try:
+                return await func(*args, **kwargs)
+            except Exception:
+                try:
+                    arguments = signature.bind_partial(*args, **kwargs).arguments
+                except TypeError:
+                    # The call itself did not match the signature; log what was passed
+                    arguments = {"args": args, "kwargs": kwargs}
+                logger.exception("Error %s with arguments %s", op, arguments)
+                raise
+
+        return wrapper
+
+    return decorator
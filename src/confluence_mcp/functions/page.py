@@ -1,24 +1,58 @@
 """Page-related MCP functions."""
 
-from typing import Dict, Any, List, Optional
+from typing import Awaitable, Callable, Dict, Any, List, Optional
 from fastmcp import FastMCP
+from functools import partial
+import asyncio
 import logging
+import math
 
-from ..api_client import get_client
+from ..api_client import MAX_PAGE_LIMIT, get_client
+from ..cursor_store import cursors
 from ..mcp_server import mcp
+from ._errors import handled
+from ..models import ConfluenceError
 
 # Set up logging
 logger = logging.getLogger("confluence_mcp.functions.page")
 
+# Latest version number seen per page ID, so updates without an explicit version can
+# skip the extra GET
+_PAGE_VERSIONS_MAXSIZE = 1024
+_page_versions: Dict[str, int] = {}
 
+# Status codes Confluence returns when the submitted version is stale
+_VERSION_CONFLICT_STATUSES = (409, 412)
+
+
+def _remember_version(id: str, page: Any) -> None:
+    """Record the version number of a page response in the version cache.
+
+    Args:
+        id: Page ID
+        page: Page returned by the API
+    """
+    number = page.get("version", {}).get("number") if isinstance(page, dict) else None
+    if not isinstance(number, int):
+        return
+
+    _page_versions.pop(id, None)
+    if len(_page_versions) >= _PAGE_VERSIONS_MAXSIZE:
+        # Evict the least recently seen page
+        del _page_versions[next(iter(_page_versions))]
+    _page_versions[id] = number
+
+
+@handled("listing pages")
 async def list_pages_impl(
     space_id: str,
     status: Optional[str] = None,
     title: Optional[str] = None,
     limit: int = 25,
     fetch_all: bool = False,
+    total: Optional[int] = None,
 ) -> Dict[str, Any]:
-    """Implementation for listing pages in a Confluence space.
+    """List pages in a Confluence space.
 
     Args:
         space_id: Space ID to list pages from
@@ -26,10 +60,18 @@ async def list_pages_impl(
         title: Filter by page title
         limit: Maximum number of pages to return per page
         fetch_all: Whether to fetch all pages of results
+        total: Number of pages to return when more than one page of results is
+            needed; the pages are requested concurrently
 
     Returns:
-        Dictionary with pages information
+        List of pages
+
+    Raises:
+        ValueError: If limit is not positive
     """
+    if limit <= 0:
+        raise ValueError(f"limit must be positive, got {limit}")
+
     client = get_client()
 
     # Build query parameters
@@ -39,68 +81,101 @@ async def list_pages_impl(
     if title:
         params["title"] = title
 
-    logger.info(f"Listing pages with params: {params}, fetch_all={fetch_all}")
-
-    try:
-        # Fetch all pages if requested
-        if fetch_all:
-            pages_list = await client.fetch_all_pages("content", params)
-            display_message = f"Retrieved {len(pages_list)} pages from space {space_id}"
-            return {"pages": pages_list, "count": len(pages_list), "message": display_message}
-        else:
-            # Fetch single page
-            pages = await client.get("content", params)
-            result_count = len(pages.get("results", []))
-            total_count = pages.get("size", 0)
-
-            display_message = f"Retrieved {result_count} pages from space {space_id}"
-            if total_count > result_count:
-                display_message += (
-                    f" (showing {result_count} of {total_count}, use fetch_all=True to get all)"
-                )
-
-            return {
-                "pages": pages.get("results", []),
-                "count": result_count,
-                "total": total_count,
-                "message": display_message,
-            }
-    except Exception as e:
-        logger.error(f"Error listing pages: {str(e)}")
-        # Re-raise the exception to be handled by FastMCP
-        raise
-
-
-@mcp.tool
-async def list_pages(
-    space_id: str,
-    status: Optional[str] = None,
-    title: Optional[str] = None,
-    limit: int = 25,
-    fetch_all: bool = False,
-) -> Dict[str, Any]:
-    """List pages in a Confluence space.
+    logger.info("Listing pages with params: %s, fetch_all=%s", params, fetch_all)
+
+    # Fetch all pages if requested
+    if fetch_all:
+        pages_list = await client.fetch_all_pages("content", params)
+        display_message = f"Retrieved {len(pages_list)} pages from space {space_id}"
+        return {"pages": pages_list, "count": len(pages_list), "message": display_message}
+    elif total and total > limit:
+        # Every page offset is known up front, so request them concurrently (bounded by
+        # the client's connection pool) without probing the first page
+        max_pages = math.ceil(total / min(limit, MAX_PAGE_LIMIT))
+        pages_list = await client.fetch_all_pages(
+            "content", params, max_pages=max_pages, known_total=True
+        )
+        pages_list = pages_list[:total]
+        display_message = f"Retrieved {len(pages_list)} pages from space {space_id}"
+        return {"pages": pages_list, "count": len(pages_list), "message": display_message}
+    else:
+        # Fetch single page
+        pages = await client.get("content", params)
+        result_count = len(pages.get("results", []))
+        total_count = pages.get("size", 0)
+
+        display_message = f"Retrieved {result_count} pages from space {space_id}"
+        if total_count > result_count:
+            display_message += (
+                f" (showing {result_count} of {total_count}, use fetch_all=True to get all)"
+            )
+
+        result = {
+            "pages": pages.get("results", []),
+            "count": result_count,
+            "total": total_count,
+            "message": display_message,
+        }
+
+        # Remember where the listing stopped so it can be resumed with the cursor
+        next_link = pages.get("_links", {}).get("next")
+        if next_link:
+            result["next_cursor"] = cursors.put("content", next_link, params)
+        return result
+
+
+list_pages = mcp.tool(list_pages_impl, name="list_pages")
+
+
+def _api_path(link: str) -> str:
+    """Convert an API link (e.g. /rest/api/content?start=25) to a client path."""
+    _, sep, path = link.partition("/rest/api/")
+    return path if sep else link.lstrip("/")
+
+
+@handled("continuing pagination")
+async def continue_pagination_impl(cursor: str) -> Dict[str, Any]:
+    """Fetch the next page of a page listing.
 
     Args:
-        space_id: Space ID to list pages from
-        status: Filter by page status ('current', 'draft', 'archived', 'trashed')
-        title: Filter by page title
-        limit: Maximum number of pages to return per page
-        fetch_all: Whether to fetch all pages of results
+        cursor: The next_cursor value returned by list_pages or continue_pagination
 
     Returns:
-        List of pages
+        Next page of pages
     """
-    return await list_pages_impl(space_id, status, title, limit, fetch_all)
+    state = cursors.get(cursor)
+    if state is None:
+        raise ValueError(f"Unknown or expired pagination cursor: {cursor}")
+
+    client = get_client()
+
+    logger.info("Continuing pagination of %s with cursor %s", state["endpoint"], cursor)
+
+    pages = await client.get(_api_path(state["next_link"]))
+    result_count = len(pages.get("results", []))
+    result = {
+        "pages": pages.get("results", []),
+        "count": result_count,
+        "message": f"Retrieved {result_count} more pages",
+    }
+
+    next_link = pages.get("_links", {}).get("next")
+    if next_link:
+        result["next_cursor"] = cursors.put(state["endpoint"], next_link, state["params"])
+    return result
+
 
+continue_pagination = mcp.tool(continue_pagination_impl, name="continue_pagination")
 
+
+@handled("getting page")
 async def get_page_impl(
     id: str,
     version: Optional[int] = None,
     body_format: Optional[str] = "storage",
     expand: Optional[List[str]] = None,
 ) -> Dict[str, Any]:
-    """Implementation for getting a page by ID.
+    """Get a page by ID.
 
     Args:
         id: Page ID
@@ -109,7 +184,7 @@ async def get_page_impl(
         expand: Additional fields to expand in the response (e.g., 'version', 'body.view', 'ancestors')
 
     Returns:
-        Dictionary with page details
+        Page details
     """
     client = get_client()
 
@@ -125,38 +200,18 @@ async def get_page_impl(
     if version:
         path = f"{path}?version={version}"
 
-    logger.info(f"Getting page {id} (version: {version}, format: {body_format})")
-
-    try:
-        page = await client.get(path, params)
-        return {"page": page, "message": f"Page {page.get('title', id)} retrieved successfully"}
-    except Exception as e:
-        logger.error(f"Error getting page {id}: {str(e)}")
-        # Re-raise the exception to be handled by FastMCP
-        raise
+    logger.info("Getting page %s (version: %s, format: %s)", id, version, body_format)
 
+    page = await client.get(path, params)
+    if not version:
+        _remember_version(id, page)
+    return {"page": page, "message": f"Page {page.get('title', id)} retrieved successfully"}
 
-@mcp.tool
-async def get_page(
-    id: str,
-    version: Optional[int] = None,
-    body_format: Optional[str] = "storage",
-    expand: Optional[List[str]] = None,
-) -> Dict[str, Any]:
-    """Get a page by ID.
-
-    Args:
-        id: Page ID
-        version: Specific version number to retrieve (optional)
-        body_format: Body format to retrieve ('storage', 'view', 'export_view', 'styled_view', 'anonymous_export_view')
-        expand: Additional fields to expand in the response (e.g., 'version', 'body.view', 'ancestors')
 
-    Returns:
-        Page details
-    """
-    return await get_page_impl(id, version, body_format, expand)
+get_page = mcp.tool(get_page_impl, name="get_page")
 
 
+@handled("creating page")
 async def create_page_impl(
     space_id: str,
     title: str,
@@ -164,7 +219,7 @@ async def create_page_impl(
     parent_id: Optional[str] = None,
     status: Optional[str] = "current",
 ) -> Dict[str, Any]:
-    """Implementation for creating a new page in Confluence.
+    """Create a new page in Confluence.
 
     Args:
         space_id: ID of the space to create page in
@@ -174,7 +229,7 @@ async def create_page_impl(
         status: Page status ('current' or 'draft')
 
     Returns:
-        Dictionary with created page details
+        Created page details
     """
     client = get_client()
 
@@ -184,40 +239,16 @@ async def create_page_impl(
     if parent_id:
         data["parentId"] = parent_id
 
-    logger.info(f"Creating page '{title}' in space {space_id}")
-
-    try:
-        page = await client.post("content", data)
-        return {"page": page, "message": f"Page '{title}' created successfully"}
-    except Exception as e:
-        logger.error(f"Error creating page '{title}': {str(e)}")
-        # Re-raise the exception to be handled by FastMCP
-        raise
+    logger.info("Creating page '%s' in space %s", title, space_id)
 
+    page = await client.post("content", data)
+    return {"page": page, "message": f"Page '{title}' created successfully"}
 
-@mcp.tool
-async def create_page(
-    space_id: str,
-    title: str,
-    body: Dict[str, Any],
-    parent_id: Optional[str] = None,
-    status: Optional[str] = "current",
-) -> Dict[str, Any]:
-    """Create a new page in Confluence.
-
-    Args:
-        space_id: ID of the space to create page in
-        title: Page title
-        body: Page body content (dict with 'representation' and 'value' keys)
-        parent_id: Parent page ID (optional)
-        status: Page status ('current' or 'draft')
 
-    Returns:
-        Created page details
-    """
-    return await create_page_impl(space_id, title, body, parent_id, status)
+create_page = mcp.tool(create_page_impl, name="create_page")
 
 
+@handled("updating page")
 async def update_page_impl(
     id: str,
     title: Optional[str] = None,
@@ -225,7 +256,7 @@ async def update_page_impl(
     version: Optional[Dict[str, Any]] = None,
     status: Optional[str] = None,
 ) -> Dict[str, Any]:
-    """Implementation for updating an existing Confluence page.
+    """Update an existing Confluence page.
 
     Args:
         id: Page ID to update
@@ -235,99 +266,162 @@ async def update_page_impl(
         status: New page status (optional, 'current' or 'draft')
 
     Returns:
-        Dictionary with updated page details
+        Updated page details
     """
     client = get_client()
 
-    logger.info(f"Updating page {id}")
+    logger.info("Updating page %s", id)
 
-    # First get the current page to get the version number if not provided
-    if not version:
-        try:
-            current_page = await client.get(f"content/{id}")
-            version = {
-                "number": current_page.get("version", {}).get("number", 1) + 1,
-                "message": "Updated via MCP",
-            }
-            logger.info(f"Auto-incrementing version to {version['number']}")
-        except Exception as e:
-            logger.error(f"Error fetching current page version: {str(e)}")
-            raise
+    async def current_version() -> Dict[str, Any]:
+        # A cached copy may predate an edit made elsewhere, so always ask the API
+        client.invalidate(f"content/{id}")
+        current_page = await client.get(f"content/{id}")
+        number = current_page.get("version", {}).get("number", 1) + 1
+        logger.info("Auto-incrementing version to %s", number)
+        return {"number": number, "message": "Updated via MCP"}
 
     # Build request data with only provided fields
-    data = {"id": id, "version": version}
+    fields = (("title", title), ("body", body), ("status", status))
+    data = {"id": id, **{key: value for key, value in fields if value}}
 
-    if title:
-        data["title"] = title
+    # Without an explicit version, use the last version seen for this page and only
+    # fetch the current page if it is unknown or turns out to be stale
+    auto_version = not version
+    if auto_version and id in _page_versions:
+        version = {"number": _page_versions[id] + 1, "message": "Updated via MCP"}
+    elif auto_version:
+        version = await current_version()
 
-    if body:
-        data["body"] = body
+    try:
+        page = await client.put(f"content/{id}", {**data, "version": version})
+    except ConfluenceError as e:
+        # An explicit version is the caller's to resolve; a derived one is refetched once
+        if not auto_version or e.status_code not in _VERSION_CONFLICT_STATUSES:
+            raise
+        logger.info("Version %s of page %s is stale, refetching", version["number"], id)
+        _page_versions.pop(id, None)
+        page = await client.put(f"content/{id}", {**data, "version": await current_version()})
 
-    if status:
-        data["status"] = status
+    _remember_version(id, page)
+    return {"page": page, "message": f"Page {page.get('title', id)} updated successfully"}
 
-    try:
-        page = await client.put(f"content/{id}", data)
-        return {"page": page, "message": f"Page {page.get('title', id)} updated successfully"}
-    except Exception as e:
-        logger.error(f"Error updating page {id}: {str(e)}")
-        # Re-raise the exception to be handled by FastMCP
-        raise
 
+update_page = mcp.tool(update_page_impl, name="update_page")
 
-@mcp.tool
-async def update_page(
-    id: str,
-    title: Optional[str] = None,
-    body: Optional[Dict[str, Any]] = None,
-    version: Optional[Dict[str, Any]] = None,
-    status: Optional[str] = None,
+
+@handled("deleting page")
+async def delete_page_impl(id: str) -> Dict[str, Any]:
+    """Delete a Confluence page.
+
+    Args:
+        id: Page ID to delete
+
+    Returns:
+        Confirmation of deletion
+    """
+    client = get_client()
+
+    logger.info("Deleting page %s", id)
+
+    await client.delete(f"content/{id}")
+    _page_versions.pop(id, None)
+    return {"id": id, "deleted": True, "message": f"Page with ID {id} deleted successfully"}
+
+
+delete_page = mcp.tool(delete_page_impl, name="delete_page")
+
+
+async def _run_batch(
+    calls: List[Callable[[], Awaitable[Dict[str, Any]]]], concurrency: int, action: str
 ) -> Dict[str, Any]:
-    """Update an existing Confluence page.
+    """Run page operations concurrently and collect per-item outcomes.
 
     Args:
-        id: Page ID to update
-        title: New page title (optional)
-        body: New page body (optional, dict with 'representation' and 'value' keys)
-        version: Version information (required, dict with 'number' and 'message' keys)
-        status: New page status (optional, 'current' or 'draft')
+        calls: Page operations to run, as zero-argument callables
+        concurrency: Maximum number of operations in flight
+        action: Verb used in the summary message (e.g. 'Created')
 
     Returns:
-        Updated page details
+        Dictionary with one result per item, in input order
     """
-    return await update_page_impl(id, title, body, version, status)
+    semaphore = asyncio.Semaphore(max(concurrency, 1))
 
+    async def run(call: Callable[[], Awaitable[Dict[str, Any]]]) -> Dict[str, Any]:
+        async with semaphore:
+            return await call()
 
-async def delete_page_impl(id: str) -> Dict[str, Any]:
-    """Implementation for deleting a Confluence page.
+    outcomes = await asyncio.gather(*(run(call) for call in calls), return_exceptions=True)
+
+    results = []
+    for outcome in outcomes:
+        # Cancelled operations come back as CancelledError, which is not an Exception
+        if isinstance(outcome, BaseException):
+            results.append({"success": False, "error": str(outcome) or type(outcome).__name__})
+        else:
+            results.append({"success": True, "result": outcome})
+
+    succeeded = sum(1 for result in results if result["success"])
+    return {
+        "results": results,
+        "count": len(results),
+        "failed": len(results) - succeeded,
+        "message": f"{action} {succeeded} of {len(results)} pages",
+    }
+
+
+@handled("creating pages")
+async def create_pages_impl(items: List[Dict[str, Any]], concurrency: int = 8) -> Dict[str, Any]:
+    """Create several pages in Confluence.
 
     Args:
-        id: Page ID to delete
+        items: Page definitions, each with the arguments accepted by create_page
+        concurrency: Maximum number of requests in flight
 
     Returns:
-        Dictionary with deletion confirmation
+        Per-item creation results (one failure does not abort the batch)
     """
-    client = get_client()
+    logger.info("Creating %s pages", len(items))
+    return await _run_batch(
+        [partial(create_page_impl, **item) for item in items], concurrency, "Created"
+    )
 
-    logger.info(f"Deleting page {id}")
 
-    try:
-        await client.delete(f"content/{id}")
-        return {"id": id, "deleted": True, "message": f"Page with ID {id} deleted successfully"}
-    except Exception as e:
-        logger.error(f"Error deleting page {id}: {str(e)}")
-        # Re-raise the exception to be handled by FastMCP
-        raise
+create_pages = mcp.tool(create_pages_impl, name="create_pages")
 
 
-@mcp.tool
-async def delete_page(id: str) -> Dict[str, Any]:
-    """Delete a Confluence page.
+@handled("updating pages")
+async def update_pages_impl(items: List[Dict[str, Any]], concurrency: int = 8) -> Dict[str, Any]:
+    """Update several existing Confluence pages.
 
     Args:
-        id: Page ID to delete
+        items: Page updates, each with the arguments accepted by update_page
+        concurrency: Maximum number of requests in flight
 
     Returns:
-        Confirmation of deletion
+        Per-item update results (one failure does not abort the batch)
     """
-    return await delete_page_impl(id)
+    logger.info("Updating %s pages", len(items))
+    return await _run_batch(
+        [partial(update_page_impl, **item) for item in items], concurrency, "Updated"
+    )
+
+
+update_pages = mcp.tool(update_pages_impl, name="update_pages")
+
+
+@handled("deleting pages")
+async def delete_pages_impl(ids: List[str], concurrency: int = 8) -> Dict[str, Any]:
+    """Delete several Confluence pages.
+
+    Args:
+        ids: Page IDs to delete
+        concurrency: Maximum number of requests in flight
+
+    Returns:
+        Per-ID deletion results (one failure does not abort the batch)
+    """
+    logger.info("Deleting %s pages", len(ids))
+    return await _run_batch([partial(delete_page_impl, id) for id in ids], concurrency, "Deleted")
+
+
+delete_pages = mcp.tool(delete_pages_impl, name="delete_pages")
@@ -1,14 +1,45 @@
 """Main entry point for the Confluence MCP server."""
 
 import logging
+
+import orjson
+
 from .config import settings
 from .mcp_server import mcp
 
+# Attributes every LogRecord has; anything else was passed through `extra`
+_RECORD_ATTRS = frozenset(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JsonFormatter(logging.Formatter):
+    """Format log records as single-line JSON objects.
+
+    Fields passed via ``extra`` are serialized with orjson alongside the message
+    instead of being interpolated into it.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        """Serialize a log record."""
+        payload = {
+            "time": self.formatTime(record),
+            "name": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        payload.update((k, v) for k, v in vars(record).items() if k not in _RECORD_ATTRS)
+        if record.exc_info:
+            payload["exc_info"] = self.formatException(record.exc_info)
+        return orjson.dumps(payload, default=str).decode()
+
+
 # Configure logging
-logging.basicConfig(
-    level=logging.DEBUG if settings.DEBUG else logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+_handler = logging.StreamHandler()
+_handler.setFormatter(
+    JsonFormatter()
+    if settings.LOG_JSON
+    else logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 )
+logging.basicConfig(level=logging.DEBUG if settings.DEBUG else logging.INFO, handlers=[_handler])
 logger = logging.getLogger("confluence_mcp")
 
 # Import functions to register them with the MCP server
@@ -16,41 +47,46 @@ from .functions import (
     list_spaces,
     get_space,
     list_pages,
+    continue_pagination,
     get_page,
     create_page,
     update_page,
     delete_page,
+    create_pages,
+    update_pages,
+    delete_pages,
     search_content,
     advanced_search,
 )
 
 
+def _log_debug_configuration():
+    """Log the loaded settings and the raw environment variables they came from."""
+    import os
+
+    logger.debug("Configuration check:")
+    logger.debug("  JIRA_BASE_URL: %s", settings.JIRA_BASE_URL or "NOT SET")
+    logger.debug("  JIRA_API_TOKEN: %s", "SET" if settings.JIRA_API_TOKEN else "NOT SET")
+    logger.debug("  JIRA_API_USER: %s", settings.JIRA_API_USER or "NOT SET")
+    logger.debug("  DEBUG: %s", settings.DEBUG)
+
+    # Also check environment variables directly
+    logger.debug("Environment variables:")
+    logger.debug("  JIRA_BASE_URL (env): %s", os.getenv("JIRA_BASE_URL", "NOT SET"))
+    logger.debug("  JIRA_API_TOKEN (env): %s", "SET" if os.getenv("JIRA_API_TOKEN") else "NOT SET")
+    logger.debug("  JIRA_API_USER (env): %s", os.getenv("JIRA_API_USER", "NOT SET"))
+    logger.debug("  DEBUG (env): %s", os.getenv("DEBUG", "NOT SET"))
+
+
 def run():
     """Run the MCP server."""
     logger.info("Starting Confluence MCP server")
 
     # Validate configuration before starting
     try:
-        logger.debug(f"Configuration check:")
-        logger.debug(
-            f"  JIRA_BASE_URL: {settings.JIRA_BASE_URL if settings.JIRA_BASE_URL else 'NOT SET'}"
-        )
-        logger.debug(f"  JIRA_API_TOKEN: {'SET' if settings.JIRA_API_TOKEN else 'NOT SET'}")
-        logger.debug(
-            f"  JIRA_API_USER: {settings.JIRA_API_USER if settings.JIRA_API_USER else 'NOT SET'}"
-        )
-        logger.debug(f"  DEBUG: {settings.DEBUG}")
-
-        # Also check environment variables directly
-        import os
-
-        logger.debug(f"Environment variables:")
-        logger.debug(f"  JIRA_BASE_URL (env): {os.getenv('JIRA_BASE_URL', 'NOT SET')}")
-        logger.debug(
-            f"  JIRA_API_TOKEN (env): {'SET' if os.getenv('JIRA_API_TOKEN') else 'NOT SET'}"
-        )
-        logger.debug(f"  JIRA_API_USER (env): {os.getenv('JIRA_API_USER', 'NOT SET')}")
-        logger.debug(f"  DEBUG (env): {os.getenv('DEBUG', 'NOT SET')}")
+        # Skip building the diagnostics entirely unless debug logging is enabled
+        if logger.isEnabledFor(logging.DEBUG):
+            _log_debug_configuration()
 
         if not settings.JIRA_BASE_URL:
             logger.error("JIRA_BASE_URL environment variable is not set!")
@@ -71,7 +107,7 @@ def run():
         logger.info("API client initialized successfully")
 
     except Exception as e:
-        logger.error(f"Configuration error: {e}")
+        logger.error("Configuration error: %s", e)
         logger.error("Please check your environment variables and try again")
         raise
 
@@ -1,3 +1,17 @@
+from contextlib import asynccontextmanager
+
 from fastmcp import FastMCP
 
-mcp = FastMCP(name="Confluence")
+from .api_client import close_client
+
+
+@asynccontextmanager
+async def lifespan(server):
+    """Close the shared API client when the server shuts down."""
+    try:
+        yield
+    finally:
+        await close_client()
+
+
+mcp = FastMCP(name="Confluence", lifespan=lifespan)
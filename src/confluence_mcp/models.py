@@ -7,24 +7,37 @@ from pydantic import BaseModel
 class ConfluenceError(Exception):
     """Confluence API error exception."""
 
-    def __init__(self, message: str, status_code: int, detailed_message: Optional[str] = None):
+    def __init__(
+        self,
+        message: str,
+        status_code: int,
+        detailed_message: Optional[str] = None,
+        url: Optional[str] = None,
+    ):
         """Initialize the error.
 
+        The string representation is only built when the error is displayed.
+
         Args:
             message: Error message
             status_code: HTTP status code
             detailed_message: Detailed error information
+            url: URL of the failed request
         """
         self.message = message
         self.status_code = status_code
         self.detailed_message = detailed_message
-        super().__init__(self.__str__())
+        self.url = url
+        super().__init__(message)
 
     def __str__(self) -> str:
         """String representation of the error."""
+        text = f"{self.message} (Status: {self.status_code})"
         if self.detailed_message:
-            return f"{self.message} (Status: {self.status_code}) - {self.detailed_message}"
-        return f"{self.message} (Status: {self.status_code})"
+            text = f"{text} - {self.detailed_message}"
+        if self.url:
+            text = f"{text} - URL: {self.url}"
+        return text
 
 
 class MCPResponse:
@@ -1,40 +1,58 @@
 #!/usr/bin/env python3
-"""Test environment variable loading."""
+"""Test environment variable loading.
+
+Usage: python test_env.py [JIRA|CONFLUENCE]
+
+The optional argument selects which variable names to report (JIRA_* by default,
+or the CONFLUENCE_* aliases).
+"""
 
 import os
 import sys
 
-sys.path.insert(0, "src")
-
-from confluence_mcp.config import settings
-
-print("=== Environment Variable Test ===")
-print()
-
-print("Direct environment variables:")
-print(f"JIRA_BASE_URL: {os.getenv('JIRA_BASE_URL', 'NOT SET')}")
-print(f"JIRA_API_TOKEN: {'SET' if os.getenv('JIRA_API_TOKEN') else 'NOT SET'}")
-print(f"JIRA_API_USER: {os.getenv('JIRA_API_USER', 'NOT SET')}")
-print(f"DEBUG: {os.getenv('DEBUG', 'NOT SET')}")
-
-print()
-print("Settings object values:")
-print(f"settings.JIRA_BASE_URL: {settings.JIRA_BASE_URL}")
-print(f"settings.JIRA_API_TOKEN: {'SET' if settings.JIRA_API_TOKEN else 'NOT SET'}")
-print(f"settings.JIRA_API_USER: {settings.JIRA_API_USER}")
-print(f"settings.DEBUG: {settings.DEBUG}")
-
-print()
-if settings.JIRA_BASE_URL:
-    print("Testing API client initialization...")
-    try:
-        from confluence_mcp.api_client import ConfluenceApiClient
-
-        client = ConfluenceApiClient()
-        print(f"✓ API client initialized successfully")
-        print(f"  Base URL: {client.base_url}")
-        print(f"  API URL: {client.api_url}")
-    except Exception as e:
-        print(f"✗ API client initialization failed: {e}")
-else:
-    print("Cannot test API client - JIRA_BASE_URL not set")
+
+def main(prefix: str = "JIRA"):
+    """Print the raw environment variables and the settings loaded from them."""
+    sys.path.insert(0, "src")
+
+    from confluence_mcp.config import _ENV_ALIASES, settings
+
+    # Snapshot the environment once instead of querying it per variable
+    env = dict(os.environ)
+    index = 1 if prefix.upper() == "CONFLUENCE" else 0
+    url_var, token_var, user_var = (names[index] for names in _ENV_ALIASES.values())
+
+    print("=== Environment Variable Test ===")
+    print()
+
+    print("Direct environment variables:")
+    print(f"{url_var}: {env.get(url_var, 'NOT SET')}")
+    print(f"{token_var}: {'SET' if env.get(token_var) else 'NOT SET'}")
+    print(f"{user_var}: {env.get(user_var, 'NOT SET')}")
+    print(f"DEBUG: {env.get('DEBUG', 'NOT SET')}")
+
+    print()
+    print("Settings object values:")
+    print(f"settings.JIRA_BASE_URL: {settings.JIRA_BASE_URL}")
+    print(f"settings.JIRA_API_TOKEN: {'SET' if settings.JIRA_API_TOKEN else 'NOT SET'}")
+    print(f"settings.JIRA_API_USER: {settings.JIRA_API_USER}")
+    print(f"settings.DEBUG: {settings.DEBUG}")
+
+    print()
+    if settings.JIRA_BASE_URL:
+        print("Testing API client initialization...")
+        try:
+            from confluence_mcp.api_client import ConfluenceApiClient
+
+            client = ConfluenceApiClient()
+            print(f"✓ API client initialized successfully")
+            print(f"  Base URL: {client.base_url}")
+            print(f"  API URL: {client.api_url}")
+        except Exception as e:
+            print(f"✗ API client initialization failed: {e}")
+    else:
+        print("Cannot test API client - JIRA_BASE_URL not set")
+
+
+if __name__ == "__main__":
+    main(*sys.argv[1:2])
@@ -0,0 +1,176 @@
+"""Shared test fixtures."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+import httpx
+import orjson
+import pytest
+
+
+@pytest.fixture(scope="session")
+def shared_api_client():
+    """Create one test API client for the whole session."""
+    # Imported here so test modules that never use the client do not load it
+    from src.confluence_mcp.api_client import ConfluenceApiClient
+
+    client = ConfluenceApiClient(
+        base_url="https://test-confluence.atlassian.net",
+        api_key="test-api-key",
+        user_email="test@example.com",
+    )
+    yield client
+    asyncio.run(client.close())
+
+
+@pytest.fixture(scope="module")
+def patched_settings():
+    """Patch the settings used by get_client for all factory tests in a module."""
+    with patch("src.confluence_mcp.api_client.settings") as settings:
+        settings.JIRA_BASE_URL = "https://test-confluence.atlassian.net"
+        settings.JIRA_API_TOKEN = "test-api-key"
+        settings.JIRA_API_USER = "test@example.com"
+        settings.CACHE_TTL = 30.0
+        yield settings
+
+
+@pytest.fixture
+def api_client(shared_api_client):
+    """Provide the shared API client, undoing any per-test changes afterwards."""
+    state = dict(vars(shared_api_client))
+    http_client = shared_api_client.client
+
+    yield shared_api_client
+
+    # Drop mocked request methods and restore replaced attributes and empty caches
+    for name in ("get", "post", "put", "delete"):
+        vars(http_client).pop(name, None)
+    vars(shared_api_client).update(state)
+    shared_api_client._cache.clear()
+    shared_api_client._inflight.clear()
+
+
+class MockRoutes:
+    """Route table for an httpx mock transport.
+
+    Tests register canned responses per (method, URL path); every request that goes
+    through the transport is recorded in ``requests``. Unrouted requests get a 404.
+    """
+
+    def __init__(self):
+        self.routes = {}
+        self.requests = []
+
+    def add(self, method: str, path: str, status_code: int = 200, **kwargs):
+        """Register a response, built per request from httpx.Response keyword arguments."""
+        self.routes[(method.upper(), path)] = (status_code, kwargs)
+
+    def handler(self, request: httpx.Request) -> httpx.Response:
+        self.requests.append(request)
+        status_code, kwargs = self.routes.get((request.method, request.url.path), (404, {}))
+        return httpx.Response(status_code, **kwargs)
+
+
+@pytest.fixture
+async def mock_routes(api_client):
+    """Route the shared API client through a mock transport instead of the network."""
+    routes = MockRoutes()
+    api_client.client = httpx.AsyncClient(
+        headers=api_client.headers, transport=httpx.MockTransport(routes.handler)
+    )
+    yield routes
+    await api_client.client.aclose()
+
+
+@pytest.fixture
+async def http_routes(api_client, mock_routes, monkeypatch):
+    """Make get_client() return the shared client, served by the mock transport.
+
+    Tests using this fixture exercise the function implementations end to end,
+    including request building and JSON decoding, without patching get_client.
+    """
+    from src.confluence_mcp import api_client as api_client_module
+
+    monkeypatch.setattr(api_client_module, "_client", api_client)
+    monkeypatch.setattr(api_client_module, "_client_loop", asyncio.get_running_loop())
+    return mock_routes
+
+
+class StubCall:
+    """Lightweight async stand-in for an API or HTTP client method.
+
+    Returns a fixed result, raises a fixed exception, or delegates to an async handler.
+    Calls are recorded on a plain Mock, so the usual call assertions
+    (``assert_called_once_with``, ``call_count``, ``call_args_list``...) are available
+    without the cost of building an AsyncMock.
+    """
+
+    def __init__(self, result=None, *, raises=None, handler=None):
+        self.result = result
+        self.raises = raises
+        self.handler = handler
+        self.recorder = Mock()
+
+    @property
+    def calls(self):
+        """The (args, kwargs) of each call, in order."""
+        return [(c.args, c.kwargs) for c in self.recorder.call_args_list]
+
+    def __getattr__(self, name):
+        if name.startswith(("assert_", "call_")):
+            return getattr(self.recorder, name)
+        raise AttributeError(name)
+
+    async def __call__(self, *args, **kwargs):
+        self.recorder(*args, **kwargs)
+        if self.raises is not None:
+            raise self.raises
+        if self.handler is not None:
+            return await self.handler(*args, **kwargs)
+        return self.result
+
+
+class StubSeq(StubCall):
+    """StubCall that returns the given results one after another.
+
+    Exception instances in the sequence are raised instead of returned.
+    """
+
+    def __init__(self, results):
+        super().__init__()
+        self._results = iter(results)
+
+    async def __call__(self, *args, **kwargs):
+        self.recorder(*args, **kwargs)
+        result = next(self._results)
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
+# Request attached to mock responses; they are never sent, so one instance is shared
+_DUMMY_REQUEST = httpx.Request("GET", "https://test-confluence.atlassian.net/wiki/rest/api/test")
+
+
+def make_response(status_code: int, content, headers=None) -> httpx.Response:
+    """Build an HTTP response for a mocked request.
+
+    Args:
+        status_code: HTTP status code
+        content: Response body, either pre-serialized bytes or JSON-serializable data
+        headers: Optional response headers
+
+    Returns:
+        The response
+    """
+    if not isinstance(content, bytes):
+        content = orjson.dumps(content)
+    return httpx.Response(
+        status_code=status_code, content=content, headers=headers, request=_DUMMY_REQUEST
+    )
+
+
+@pytest.fixture(scope="module")
+def mock_response():
+    """Create a mock HTTP response helper."""
+    return make_response
@@ -4,48 +4,68 @@ This module consolidates all API client tests into a single comprehensive test s
 covering basic operations, error handling, authentication, retry mechanisms, and pagination.
 """
 
+import asyncio
+import threading
 import pytest
 import httpx
-import json
-import base64
-from unittest.mock import AsyncMock, MagicMock, patch
-
-from src.confluence_mcp.api_client import ConfluenceApiClient, get_client, retry_on_connection_error
+import orjson
+from unittest.mock import MagicMock
+
+from src.confluence_mcp.api_client import (
+    DEFAULT_LIMITS,
+    DEFAULT_PAGE_LIMIT,
+    MAX_PAGE_LIMIT,
+    MAX_SPECULATIVE_PAGES,
+    ConfluenceApiClient,
+    _basic_auth_header,
+    close_client,
+    get_client,
+    retry_on_connection_error,
+)
 from src.confluence_mcp.models import ConfluenceError
+from tests.conftest import StubCall, StubSeq
 
+# Basic auth header for test@example.com:test-api-key
+EXPECTED_AUTH = "Basic dGVzdEBleGFtcGxlLmNvbTp0ZXN0LWFwaS1rZXk="
 
-@pytest.fixture
-def api_client():
-    """Create a test API client."""
-    client = ConfluenceApiClient(
-        base_url="https://test-confluence.atlassian.net",
-        api_key="test-api-key",
-        user_email="test@example.com",
-    )
-    return client
+# Serialized pagination payloads shared by the fetch_all_pages tests
+FIRST_PAGE = (
+    b'{"results":[{"id":"1","title":"Page 1"},{"id":"2","title":"Page 2"}],"size":2,'
+    b'"_links":{"next":"/wiki/rest/api/content?start=2&limit=2"}}'
+)
+LAST_PAGE = b'{"results":[{"id":"3","title":"Page 3"}],"size":1,"_links":{}}'
 
 
 @pytest.fixture
-def mock_response():
-    """Create a mock HTTP response helper."""
-
-    def _create_response(
-        status_code: int,
-        data: dict,
-        url: str = "https://test-confluence.atlassian.net/wiki/rest/api/test",
-    ):
-        return httpx.Response(
-            status_code=status_code,
-            content=json.dumps(data).encode(),
-            request=httpx.Request("GET", url),
-        )
-
-    return _create_response
+def sleep(monkeypatch):
+    """Replace the retry back-off sleep with a recording no-op."""
+    stub = StubCall()
+    monkeypatch.setattr("src.confluence_mcp.api_client.asyncio.sleep", stub)
+    return stub
 
 
 class TestApiClientInitialization:
     """Test API client initialization and configuration."""
 
+    @pytest.fixture
+    async def make_client(self):
+        """Build standalone clients that are closed even when the test fails."""
+        clients = []
+
+        def make(**kwargs):
+            options = {
+                "base_url": "https://test-confluence.atlassian.net",
+                "api_key": "test-api-key",
+                "user_email": "test@example.com",
+                **kwargs,
+            }
+            clients.append(ConfluenceApiClient(**options))
+            return clients[-1]
+
+        yield make
+        for client in clients:
+            await client.close()
+
     @pytest.mark.asyncio
     async def test_basic_initialization(self, api_client):
         """Test basic API client initialization."""
@@ -53,13 +73,13 @@ class TestApiClientInitialization:
         assert api_client.api_key == "test-api-key"
         assert api_client.user_email == "test@example.com"
         assert api_client.api_url == "https://test-confluence.atlassian.net/wiki/rest/api"
-
-        await api_client.close()
+        assert api_client._url("/spaces") == api_client._url("spaces")
+        assert api_client._url("spaces") == f"{api_client.api_url}/spaces"
 
     @pytest.mark.asyncio
-    async def test_initialization_with_custom_params(self):
+    async def test_initialization_with_custom_params(self, make_client):
         """Test API client initialization with custom parameters."""
-        client = ConfluenceApiClient(
+        client = make_client(
             base_url="https://custom.atlassian.net",
             api_key="custom_api_key",
             user_email="custom@example.com",
@@ -71,117 +91,75 @@ class TestApiClientInitialization:
         assert client.api_key == "custom_api_key"
         assert client.user_email == "custom@example.com"
 
-        await client.close()
+    @pytest.mark.asyncio
+    async def test_http2_can_be_disabled(self, make_client):
+        """Test that HTTP/2 negotiation can be turned off."""
+        client = make_client(http2=False)
+
+        assert client.http2 is False
 
     @pytest.mark.asyncio
-    async def test_authentication_headers(self):
+    async def test_authentication_headers(self, make_client):
         """Test that authentication headers are correctly set."""
-        client = ConfluenceApiClient(
-            base_url="https://test-confluence.atlassian.net",
-            api_key="test-api-key",
-            user_email="test@example.com",
-        )
+        client = make_client()
 
         # Check the authorization header
-        expected_auth = base64.b64encode(b"test@example.com:test-api-key").decode()
-        assert client.headers["Authorization"] == f"Basic {expected_auth}"
+        assert client.headers["Authorization"] == EXPECTED_AUTH
 
-        # Check content type and accept headers
-        assert client.headers["Content-Type"] == "application/json"
-        assert client.headers["Accept"] == "application/json"
+        # A second client with the same credentials reuses the encoded header
+        hits = _basic_auth_header.cache_info().hits
+        other = make_client()
+        assert other.headers["Authorization"] == client.headers["Authorization"]
+        assert _basic_auth_header.cache_info().hits == hits + 1
 
-        await client.close()
+        # Check accept header; Content-Type is only sent with request bodies
+        assert client.headers["Accept"] == "application/json"
+        assert "Content-Type" not in client.headers
 
 
 class TestHttpMethods:
     """Test HTTP methods (GET, POST, PUT, DELETE)."""
 
     @pytest.mark.asyncio
-    async def test_get_successful_request(self, api_client, mock_response):
-        """Test a successful GET request."""
-        test_response = {"results": [{"id": "123", "name": "Test Space"}]}
-
-        api_client.client.get = AsyncMock(return_value=mock_response(200, test_response))
-
-        response = await api_client.get("spaces", {"limit": 10})
-        assert response == test_response
-
-        # Verify the call
-        api_client.client.get.assert_called_once()
-
-        await api_client.close()
-
-    @pytest.mark.asyncio
-    async def test_post_successful_request(self, api_client, mock_response):
-        """Test a successful POST request."""
-        request_data = {"title": "New Page", "spaceId": "123", "status": "current"}
-        test_response = {"id": "456", "title": "New Page", "spaceId": "123"}
-
-        api_client.client.post = AsyncMock(return_value=mock_response(200, test_response))
-
-        response = await api_client.post("content", request_data)
-        assert response == test_response
-
-        # Verify the call
-        api_client.client.post.assert_called_once()
-
-        await api_client.close()
-
-    @pytest.mark.asyncio
-    async def test_put_successful_request(self, api_client, mock_response):
-        """Test a successful PUT request."""
-        request_data = {"id": "456", "title": "Updated Page", "version": {"number": 2}}
-        test_response = {"id": "456", "title": "Updated Page", "version": {"number": 2}}
-
-        api_client.client.put = AsyncMock(return_value=mock_response(200, test_response))
-
-        response = await api_client.put("content/456", request_data)
-        assert response == test_response
-
-        # Verify the call
-        api_client.client.put.assert_called_once()
-
-        await api_client.close()
-
-    @pytest.mark.asyncio
-    async def test_delete_successful_request(self, api_client):
-        """Test a successful DELETE request."""
-        api_client.client.delete = AsyncMock(
-            return_value=httpx.Response(
-                status_code=204,
-                content=b"",
-                request=httpx.Request(
-                    "DELETE", "https://test-confluence.atlassian.net/wiki/rest/api/content/456"
-                ),
-            )
-        )
-
-        response = await api_client.delete("content/456")
-        assert response == {}
+    @pytest.mark.parametrize(
+        "method,path,body,status,result",
+        [
+            ("get", "spaces", None, 200, {"results": [{"id": "123", "name": "Test Space"}]}),
+            ("post", "content", {"title": "New Page", "spaceId": "123"}, 200, {"id": "456"}),
+            ("put", "content/456", {"title": "Updated Page"}, 200, {"id": "456"}),
+            ("delete", "content/456", None, 204, {}),
+        ],
+    )
+    async def test_successful_request(
+        self, api_client, mock_routes, method, path, body, status, result
+    ):
+        """Test a successful request for each HTTP method."""
+        url_path = f"/wiki/rest/api/{path}"
+        mock_routes.add(method, url_path, status, json=result if status != 204 else None)
 
-        # Verify the call
-        api_client.client.delete.assert_called_once()
+        args = (path,) if body is None else (path, body)
+        response = await getattr(api_client, method)(*args)
+        assert response == result
 
-        await api_client.close()
+        # Verify the request on the wire, and that payloads are sent as a JSON body
+        (request,) = mock_routes.requests
+        assert request.method == method.upper()
+        assert request.url.path == url_path
+        assert request.headers["Authorization"] == api_client.headers["Authorization"]
+        if body is not None:
+            assert orjson.loads(request.content) == body
+            assert request.headers["Content-Type"] == "application/json"
 
 
 class TestErrorHandling:
     """Test error handling and exception scenarios."""
 
     @pytest.mark.asyncio
-    async def test_get_error_response(self, api_client):
+    async def test_get_error_response(self, api_client, mock_response):
         """Test handling of an error response."""
         error_response = {"message": "Not found", "details": "The requested resource was not found"}
 
-        api_client.client.get = AsyncMock(
-            return_value=httpx.Response(
-                status_code=404,
-                content=json.dumps(error_response).encode(),
-                request=httpx.Request(
-                    "GET", "https://test-confluence.atlassian.net/wiki/rest/api/spaces/INVALID"
-                ),
-            )
-        )
+        api_client.client.get = StubCall(mock_response(404, error_response))
 
         with pytest.raises(ConfluenceError) as exc_info:
             await api_client.get("spaces/INVALID")
@@ -190,14 +168,25 @@ class TestErrorHandling:
         assert exc_info.value.message == "Not found"
         assert exc_info.value.detailed_message == "The requested resource was not found"
 
-        await api_client.close()
+    @pytest.mark.asyncio
+    async def test_non_json_error_uses_default_message(self, api_client, mock_response):
+        """Test that non-JSON error bodies fall back to the status-specific message."""
+        api_client.client.get = StubCall(
+            mock_response(404, b"<html>Not Found</html>", headers={"Content-Type": "text/html"})
+        )
+
+        with pytest.raises(ConfluenceError) as exc_info:
+            await api_client.get("spaces/INVALID")
+
+        assert exc_info.value.status_code == 404
+        assert exc_info.value.message == "Resource not found. Please check the ID or path."
 
     @pytest.mark.asyncio
-    async def test_network_error_handling(self, api_client):
+    async def test_network_error_handling(self, api_client, sleep):
         """Test handling of network errors."""
         # Mock a network error
-        api_client.client.get = AsyncMock(
-            side_effect=httpx.RequestError("Connection error", request=MagicMock())
+        api_client.client.get = StubCall(
+            raises=httpx.RequestError("Connection error", request=MagicMock())
         )
 
         # Test that the error is properly caught and wrapped
@@ -206,16 +195,17 @@ class TestErrorHandling:
 
         assert "Connection error" in exc_info.value.message
         assert exc_info.value.status_code == 0  # No HTTP status code for network errors
-
-        await api_client.close()
+        assert exc_info.value.url == "https://test-confluence.atlassian.net/wiki/rest/api/spaces"
+        assert str(exc_info.value).endswith(f"URL: {exc_info.value.url}")
+        # The request was retried before the error was reported
+        assert len(api_client.client.get.calls) == 4
 
 
 class TestRetryMechanism:
     """Test retry mechanism for connection errors."""
 
     @pytest.mark.asyncio
-    @patch("src.confluence_mcp.api_client.asyncio.sleep")
-    async def test_retry_on_connection_error_success(self, mock_sleep):
+    async def test_retry_on_connection_error_success(self, sleep):
         """Test retry mechanism on connection errors with eventual success."""
         # Create a test method with the retry decorator
         call_count = 0
@@ -239,12 +229,11 @@ class TestRetryMechanism:
 
         # Verify retry behavior
         assert call_count == 3
-        assert mock_sleep.call_count == 2  # Sleep should be called twice for 2 retries
+        assert len(sleep.calls) == 2  # Sleep should be called twice for 2 retries
         assert result == {"success": True}
 
     @pytest.mark.asyncio
-    @patch("src.confluence_mcp.api_client.asyncio.sleep")
-    async def test_retry_exhaustion(self, mock_sleep):
+    async def test_retry_exhaustion(self, sleep):
         """Test that retry mechanism eventually gives up after max retries."""
         call_count = 0
 
@@ -267,7 +256,76 @@ class TestRetryMechanism:
 
         # Verify retry behavior
         assert call_count == 4  # Initial + 3 retries
-        assert mock_sleep.call_count == 3  # Sleep should be called 3 times for 3 retries
+        assert len(sleep.calls) == 3  # Sleep should be called 3 times for 3 retries
+
+    @pytest.mark.asyncio
+    async def test_retry_delay_is_jittered_and_capped(self, sleep):
+        """Test that retry delays stay within the capped exponential bound."""
+
+        @retry_on_connection_error(max_retries=5, retry_delay=1.0, max_delay=3.0)
+        async def test_method():
+            raise httpx.RequestError(
+                "Persistent connection error",
+                request=httpx.Request("GET", "https://test.atlassian.net"),
+            )
+
+        with pytest.raises(httpx.RequestError):
+            await test_method()
+
+        delays = [args[0] for args, _ in sleep.calls]
+        bounds = [1.0, 2.0, 3.0, 3.0, 3.0]
+        assert len(delays) == len(bounds)
+        assert all(0 <= d <= b for d, b in zip(delays, bounds))
+
+    @pytest.mark.asyncio
+    async def test_get_retries_connection_error(self, api_client, mock_response, sleep):
+        """Test that a GET through the client is retried after a connection error."""
+        request = httpx.Request("GET", "https://test-confluence.atlassian.net")
+        api_client.client.get = StubSeq(
+            [httpx.ConnectError("Connection refused", request=request)]
+            + [mock_response(200, {"results": []})]
+        )
+
+        result = await api_client.get("spaces")
+
+        assert result == {"results": []}
+        assert len(api_client.client.get.calls) == 2
+        assert len(sleep.calls) == 1
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("method,args", [("post", ({"a": 1},)), ("delete", ())])
+    async def test_write_retries_then_raises_confluence_error(
+        self, api_client, sleep, method, args
+    ):
+        """Test that writes are retried on connection errors before failing."""
+        request = httpx.Request(method.upper(), "https://test-confluence.atlassian.net")
+        stub = StubCall(raises=httpx.ConnectError("Connection refused", request=request))
+        setattr(api_client.client, method, stub)
+
+        with pytest.raises(ConfluenceError) as exc_info:
+            await getattr(api_client, method)("content/123", *args)
+
+        assert exc_info.value.status_code == 0
+        assert len(stub.calls) == 4  # Initial + 3 retries
+        assert len(sleep.calls) == 3
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "method,args,attempts",
+        [("post", ({"a": 1},), 1), ("put", ({"a": 1},), 4), ("delete", (), 4)],
+    )
+    async def test_read_timeout_retried_only_for_idempotent_requests(
+        self, api_client, sleep, method, args, attempts
+    ):
+        """Test that a POST the server may already have applied is not sent again."""
+        request = httpx.Request(method.upper(), "https://test-confluence.atlassian.net")
+        stub = StubCall(raises=httpx.ReadTimeout("Timed out", request=request))
+        setattr(api_client.client, method, stub)
+
+        with pytest.raises(ConfluenceError):
+            await getattr(api_client, method)("content/123", *args)
+
+        assert len(stub.calls) == attempts
 
 
 class TestPagination:
@@ -282,7 +340,7 @@ class TestPagination:
             "_links": {},  # No next link indicates last page
         }
 
-        api_client.client.get = AsyncMock(return_value=mock_response(200, test_response))
+        api_client.client.get = StubCall(mock_response(200, test_response))
 
         results = await api_client.fetch_all_pages("content", {"limit": 10})
 
@@ -291,44 +349,18 @@ class TestPagination:
         assert results[1]["id"] == "2"
 
         # Should only make one call since there's no next page
-        api_client.client.get.assert_called_once()
-
-        await api_client.close()
+        assert len(api_client.client.get.calls) == 1
 
     @pytest.mark.asyncio
-    async def test_fetch_all_pages_multiple_pages(self, api_client):
+    async def test_fetch_all_pages_multiple_pages(self, api_client, mock_response):
         """Test fetch_all_pages with multiple pages of results."""
         # First page response
-        first_response = httpx.Response(
-            status_code=200,
-            content=json.dumps(
-                {
-                    "results": [{"id": "1", "title": "Page 1"}, {"id": "2", "title": "Page 2"}],
-                    "size": 2,
-                    "_links": {"next": "/wiki/rest/api/content?start=2&limit=2"},
-                }
-            ).encode(),
-            request=httpx.Request(
-                "GET", "https://test-confluence.atlassian.net/wiki/rest/api/content"
-            ),
-        )
+        first_response = mock_response(200, FIRST_PAGE)
 
         # Second page response (last page)
-        second_response = httpx.Response(
-            status_code=200,
-            content=json.dumps(
-                {
-                    "results": [{"id": "3", "title": "Page 3"}],
-                    "size": 1,
-                    "_links": {},  # No next link
-                }
-            ).encode(),
-            request=httpx.Request(
-                "GET", "https://test-confluence.atlassian.net/wiki/rest/api/content"
-            ),
-        )
+        second_response = mock_response(200, LAST_PAGE)
 
-        api_client.client.get = AsyncMock(side_effect=[first_response, second_response])
+        api_client.client.get = StubSeq([first_response, second_response])
 
         results = await api_client.fetch_all_pages("content", {"limit": 2})
 
@@ -338,29 +370,15 @@ class TestPagination:
         assert results[2]["id"] == "3"
 
         # Should make two calls
-        assert api_client.client.get.call_count == 2
-
-        await api_client.close()
+        assert len(api_client.client.get.calls) == 2
 
     @pytest.mark.asyncio
-    async def test_fetch_all_pages_with_max_pages(self, api_client):
+    async def test_fetch_all_pages_with_max_pages(self, api_client, mock_response):
         """Test fetch_all_pages with max_pages limit."""
         # First page response
-        first_response = httpx.Response(
-            status_code=200,
-            content=json.dumps(
-                {
-                    "results": [{"id": "1", "title": "Page 1"}, {"id": "2", "title": "Page 2"}],
-                    "size": 2,
-                    "_links": {"next": "/wiki/rest/api/content?start=2&limit=2"},
-                }
-            ).encode(),
-            request=httpx.Request(
-                "GET", "https://test-confluence.atlassian.net/wiki/rest/api/content"
-            ),
-        )
+        first_response = mock_response(200, FIRST_PAGE)
 
-        api_client.client.get = AsyncMock(return_value=first_response)
+        api_client.client.get = StubCall(first_response)
 
         # Limit to 1 page only
         results = await api_client.fetch_all_pages("content", {"limit": 2}, max_pages=1)
@@ -370,33 +388,345 @@ class TestPagination:
         assert results[1]["id"] == "2"
 
         # Should only make one call due to max_pages limit
-        api_client.client.get.assert_called_once()
+        assert len(api_client.client.get.calls) == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_pages_known_page_count(self, api_client, mock_response):
+        """Test that known_total requests exactly max_pages pages without a probe."""
+
+        async def get_page(url, params=None):
+            start = params["start"]
+            return mock_response(200, {"results": [{"id": start}, {"id": start + 1}]})
+
+        api_client.client.get = StubCall(handler=get_page)
+
+        results = await api_client.fetch_all_pages(
+            "content", {"limit": 2}, max_pages=2, known_total=True
+        )
+
+        assert [r["id"] for r in results] == [0, 1, 2, 3]
+        starts = sorted(kwargs["params"]["start"] for _, kwargs in api_client.client.get.calls)
+        assert starts == [0, 2]
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_pages_with_known_total(self, api_client, mock_response):
+        """Test fetch_all_pages requests remaining pages concurrently when total is known."""
+
+        async def get_page(url, params=None):
+            start = params["start"]
+            ids = [str(i) for i in range(start, min(start + 2, 5))]
+            return mock_response(
+                200,
+                {
+                    "results": [{"id": i} for i in ids],
+                    "totalSize": 5,
+                    "_links": {"next": "/wiki/rest/api/search?next=true"},
+                },
+            )
+
+        api_client.client.get = StubCall(handler=get_page)
+
+        results = await api_client.fetch_all_pages("search", {"limit": 2})
+
+        assert [r["id"] for r in results] == ["0", "1", "2", "3", "4"]
+        assert len(api_client.client.get.calls) == 3
+        starts = sorted(kwargs["params"]["start"] for _, kwargs in api_client.client.get.calls)
+        assert starts == [0, 2, 4]
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_pages_cancels_remaining_on_error(self, api_client, mock_response):
+        """Test that a failing page stops the pages that have not been requested yet."""
+
+        async def get_page(url, params=None):
+            start = params["start"]
+            if start == 4:
+                return mock_response(500, {"message": "Server error"})
+            await asyncio.sleep(0)
+            return mock_response(
+                200, {"results": [{"id": start}, {"id": start + 1}], "totalSize": 20}
+            )
+
+        api_client.client.get = StubCall(handler=get_page)
+
+        with pytest.raises(ConfluenceError):
+            await api_client.fetch_all_pages("search", {"limit": 2}, concurrency=2)
+
+        # Give any requests left running a chance to go out before counting
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        # Ten pages in total, but requests stop shortly after the failure
+        assert len(api_client.client.get.calls) < 10
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_pages_cancels_in_flight_requests(self, api_client, mock_response):
+        """Test that slow requests already on the wire are cancelled when a page fails."""
+        cancelled, completed = [], []
+
+        async def get_page(url, params=None):
+            start = params["start"]
+            if start == 0:
+                return mock_response(200, {"results": [{"id": 0}, {"id": 1}], "totalSize": 20})
+            if start == 2:
+                # Fail only once the other pages of the batch are in flight
+                await asyncio.sleep(0.01)
+                return mock_response(500, {"message": "Server error"})
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.append(start)
+                raise
+            completed.append(start)
+            return mock_response(200, {"results": [{"id": start}, {"id": start + 1}]})
+
+        api_client.client.get = StubCall(handler=get_page)
+
+        with pytest.raises(ConfluenceError):
+            await api_client.fetch_all_pages("search", {"limit": 2}, concurrency=4)
+        for _ in range(20):
+            await asyncio.sleep(0)
+
+        # The slow pages sent alongside the failing one were cancelled, not left running
+        assert {4, 6, 8} <= set(cancelled)
+        assert completed == []
+        assert not api_client._inflight
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_pages_speculative_windows(self, api_client, mock_response):
+        """Test fetch_all_pages fetches ahead concurrently when the total is unknown."""
+
+        async def get_page(url, params=None):
+            start = params["start"]
+            ids = [str(i) for i in range(start, min(start + 2, 9))]
+            return mock_response(200, {"results": [{"id": i} for i in ids]})
+
+        api_client.client.get = StubCall(handler=get_page)
+
+        results = await api_client.fetch_all_pages("content", {"limit": 2}, concurrency=4)
+
+        assert [r["id"] for r in results] == [str(i) for i in range(9)]
+        # Windows of 1, 1, 2 and 4 pages; the last window overshoots the short page
+        starts = sorted(kwargs["params"]["start"] for _, kwargs in api_client.client.get.calls)
+        assert starts == [0, 2, 4, 6, 8, 10, 12, 14]
+
+    @pytest.mark.asyncio
+    async def test_fetch_all_pages_speculative_overshoot_is_capped(self, api_client, mock_response):
+        """Test that fetching ahead wastes only a few requests at the default concurrency."""
+
+        async def get_page(url, params=None):
+            start = params["start"]
+            return mock_response(
+                200, {"results": [{"id": i} for i in range(start, min(start + 2, 81))]}
+            )
+
+        api_client.client.get = StubCall(handler=get_page)
+
+        results = await api_client.fetch_all_pages("content", {"limit": 2})
+
+        # 41 pages, the last one short; windows stop growing at MAX_SPECULATIVE_PAGES
+        assert len(results) == 81
+        assert len(api_client.client.get.calls) <= 41 + MAX_SPECULATIVE_PAGES - 1
 
-        await api_client.close()
+    @pytest.mark.asyncio
+    async def test_fetch_all_pages_default_limit(self, api_client, mock_response):
+        """Test that fetch_all_pages uses a large default page size, capped at the server max."""
+        api_client.client.get = StubCall(mock_response(200, {"results": []}))
+
+        await api_client.fetch_all_pages("content")
+        assert api_client.client.get.calls[-1][1]["params"]["limit"] == DEFAULT_PAGE_LIMIT
+
+        await api_client.fetch_all_pages("spaces", {"limit": 1000})
+        assert api_client.client.get.calls[-1][1]["params"]["limit"] == MAX_PAGE_LIMIT
+
+
+class TestResponseCache:
+    """Test caching of GET responses."""
+
+    @pytest.mark.asyncio
+    async def test_repeated_get_served_from_cache(self, api_client, mock_response):
+        """Test that an identical GET within the TTL does not hit the network."""
+        test_response = {"results": [{"id": "123"}]}
+        api_client.client.get = StubCall(mock_response(200, test_response))
+
+        first = await api_client.get("spaces", {"limit": 10})
+        second = await api_client.get("spaces", {"limit": 10})
+
+        assert first == second == test_response
+        assert len(api_client.client.get.calls) == 1
+
+        # Different params are cached separately
+        await api_client.get("spaces", {"limit": 20})
+        assert len(api_client.client.get.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_list_valued_params_are_cached(self, api_client, mock_response):
+        """Test that GETs with list-valued params are sent and cached like any other."""
+        api_client.client.get = StubCall(mock_response(200, {"results": []}))
+
+        await api_client.get("content", {"expand": ["body", "version"]})
+        await api_client.get("content", {"expand": ("body", "version")})
+
+        assert len(api_client.client.get.calls) == 1
+        assert api_client.client.get.calls[0][1]["params"] == {"expand": ["body", "version"]}
+
+    @pytest.mark.asyncio
+    async def test_no_store_response_not_cached(self, api_client, mock_response):
+        """Test that responses marked Cache-Control: no-store are not cached."""
+        api_client.client.get = StubCall(
+            mock_response(200, b'{"id": "123"}', headers={"Cache-Control": "no-store"})
+        )
+
+        await api_client.get("content/123")
+        await api_client.get("content/123")
+
+        assert len(api_client.client.get.calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_write_invalidates_cached_resource(self, api_client, mock_response):
+        """Test that a PUT evicts cached GETs for the same resource collection."""
+        api_client.client.get = StubCall(mock_response(200, {"id": "123"}))
+        api_client.client.put = StubCall(mock_response(200, {"id": "123"}))
+
+        await api_client.get("content/123")
+        await api_client.get("spaces/1")
+        await api_client.put("content/123", {"title": "Updated"})
+        await api_client.get("content/123")
+        await api_client.get("spaces/1")
+
+        # content/123 is fetched again, spaces/1 is still cached
+        assert len(api_client.client.get.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_gets_share_request(self, api_client, mock_response):
+        """Test that identical GETs issued concurrently send a single request."""
+        api_client.cache_ttl = 0
+        release = asyncio.Event()
+
+        async def slow_get(url, params=None):
+            await release.wait()
+            return mock_response(200, {"id": "123"})
+
+        api_client.client.get = StubCall(handler=slow_get)
+
+        waiters = [asyncio.create_task(api_client.get("content/123")) for _ in range(3)]
+        other = asyncio.create_task(api_client.get("content/456"))
+        await asyncio.sleep(0)
+        release.set()
+
+        assert await asyncio.gather(*waiters) == [{"id": "123"}] * 3
+        await other
+        assert len(api_client.client.get.calls) == 2
+
+        # Once finished, the next identical GET goes out again (caching is disabled)
+        await api_client.get("content/123")
+        assert len(api_client.client.get.calls) == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_get(self, api_client, mock_response):
+        """Test that cancelling one caller leaves the shared request running for others."""
+        release = asyncio.Event()
+
+        async def slow_get(url, params=None):
+            await release.wait()
+            return mock_response(200, {"id": "123"})
+
+        api_client.client.get = StubCall(handler=slow_get)
+
+        first = asyncio.create_task(api_client.get("content/123"))
+        second = asyncio.create_task(api_client.get("content/123"))
+        await asyncio.sleep(0)
+        first.cancel()
+        release.set()
+
+        assert await second == {"id": "123"}
+        assert first.cancelled()
+        assert len(api_client.client.get.calls) == 1
 
 
 class TestFactoryFunction:
     """Test the get_client factory function."""
 
     @pytest.mark.asyncio
-    @patch("src.confluence_mcp.api_client.settings")
-    async def test_get_client_factory(self, mock_settings):
+    async def test_get_client_factory(self, patched_settings):
         """Test the get_client factory function."""
-        # Configure mock settings
-        mock_settings.JIRA_BASE_URL = "https://test-confluence.atlassian.net"
-        mock_settings.JIRA_API_TOKEN = "test-api-key"
-        mock_settings.JIRA_API_USER = "test@example.com"
-
         # Get a client using the factory function
+        await close_client()
         client = get_client()
 
         # Verify the client was configured with settings
         assert client.base_url == "https://test-confluence.atlassian.net"
         assert client.api_key == "test-api-key"
         assert client.user_email == "test@example.com"
+        assert client.cache_ttl == patched_settings.CACHE_TTL
 
         await client.close()
 
+    @pytest.mark.asyncio
+    async def test_get_client_reuses_instance(self, patched_settings):
+        """Test that get_client shares one client until it is closed."""
+        await close_client()
+        client = get_client()
+
+        # Repeated calls return the same instance
+        assert get_client() is client
+
+        # Closing the shared client makes the next call build a new one
+        await close_client()
+        assert client.client.is_closed
+        new_client = get_client()
+        assert new_client is not client
+
+        await close_client()
+
+    def test_get_client_per_event_loop(self, patched_settings):
+        """Test that a client created on one event loop is not reused on another."""
+
+        async def shared_client():
+            return get_client(), get_client()
+
+        async def replace_client():
+            client = get_client()
+            await close_client()
+            return client
+
+        first, same = asyncio.run(shared_client())
+        second = asyncio.run(replace_client())
+
+        assert first is same
+        assert second is not first
+        # The replaced client is closed rather than leaked
+        assert first.client.is_closed
+        assert second.client.is_closed
+
+    def test_get_client_closes_old_client_on_its_running_loop(self, patched_settings):
+        """Test that a client replaced from another thread is closed on its own loop."""
+        other_loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=other_loop.run_forever)
+        thread.start()
+        try:
+
+            async def create_client():
+                return get_client()
+
+            first = asyncio.run_coroutine_threadsafe(create_client(), other_loop).result()
+            second = asyncio.run(create_client())
+
+            # The close was scheduled on the first client's loop; wait for it there
+            asyncio.run_coroutine_threadsafe(asyncio.sleep(0.1), other_loop).result()
+            assert second is not first
+            assert first.client.is_closed
+        finally:
+            other_loop.call_soon_threadsafe(other_loop.stop)
+            thread.join()
+            other_loop.close()
+            asyncio.run(close_client())
+
+    def test_default_pool_limits(self, api_client):
+        """Test the default connection pool and timeout configuration."""
+        assert api_client.limits is DEFAULT_LIMITS
+        assert api_client.client.timeout.connect == 5.0
+        assert api_client.client.timeout.read == 30.0
+
 
 if __name__ == "__main__":
     pytest.main([__file__])
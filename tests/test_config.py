@@ -4,30 +4,48 @@ import pytest
 from unittest.mock import patch
 import os
 
-from src.confluence_mcp.config import Settings
+from src.confluence_mcp.config import _ENV_ALIASES, Settings
+
+# Environment used by the settings initialization test (credentials are set per test)
+ENV_VARS = {
+    "DEBUG": "true",
+    "HOST": "localhost",
+    "PORT": "3000",
+    "CACHE_TTL": "5",
+    "LOG_JSON": "yes",
+}
 
 
 @pytest.fixture
-def env_vars():
-    """Set up test environment variables."""
-    os.environ["JIRA_BASE_URL"] = "https://test-confluence.atlassian.net"
-    os.environ["JIRA_API_TOKEN"] = "test-api-key"
-    os.environ["JIRA_API_USER"] = "test@example.com"
-    os.environ["DEBUG"] = "true"
-    os.environ["HOST"] = "localhost"
-    os.environ["PORT"] = "3000"
+def env_vars(monkeypatch):
+    """Set up test environment variables, restored automatically afterwards."""
+    for key, value in ENV_VARS.items():
+        monkeypatch.setenv(key, value)
+
 
-    yield
+@pytest.fixture
+def env_file(tmp_path):
+    """Path to a dotenv file that does not exist, so a local .env cannot affect the tests."""
+    return str(tmp_path / "missing.env")
 
-    # Clean up
-    for key in ["JIRA_BASE_URL", "JIRA_API_TOKEN", "JIRA_API_USER", "DEBUG", "HOST", "PORT"]:
-        if key in os.environ:
-            del os.environ[key]
 
+@pytest.mark.parametrize(
+    "url_var,token_var,user_var",
+    [
+        ("JIRA_BASE_URL", "JIRA_API_TOKEN", "JIRA_API_USER"),
+        ("CONFLUENCE_URL", "CONFLUENCE_API_KEY", "CONFLUENCE_USER_EMAIL"),
+    ],
+)
+def test_settings_initialization(env_vars, env_file, monkeypatch, url_var, token_var, user_var):
+    """Test that settings are correctly initialized under either variable prefix."""
+    for names in _ENV_ALIASES.values():
+        for name in names:
+            monkeypatch.delenv(name, raising=False)
+    monkeypatch.setenv(url_var, "https://test-confluence.atlassian.net/")
+    monkeypatch.setenv(token_var, "test-api-key")
+    monkeypatch.setenv(user_var, "test@example.com")
 
-def test_settings_initialization(env_vars):
-    """Test that settings are correctly initialized from environment variables."""
-    settings = Settings()
+    settings = Settings.from_env(env_file=env_file)
 
     assert settings.JIRA_BASE_URL == "https://test-confluence.atlassian.net"
     assert settings.JIRA_API_TOKEN == "test-api-key"
@@ -35,9 +53,11 @@ def test_settings_initialization(env_vars):
     assert settings.DEBUG is True
     assert settings.HOST == "localhost"
     assert settings.PORT == 3000
+    assert settings.CACHE_TTL == 5.0
+    assert settings.LOG_JSON is True
 
 
-def test_confluence_url_validator():
+def test_confluence_url_validator(env_file):
     """Test the URL validator."""
     # URL with trailing slash
     with patch.dict(
@@ -48,7 +68,7 @@ def test_confluence_url_validator():
             "JIRA_API_USER": "test@example.com",
         },
     ):
-        settings = Settings()
+        settings = Settings.from_env(env_file=env_file)
         assert settings.JIRA_BASE_URL == "https://test-confluence.atlassian.net"
 
     # URL without scheme
@@ -61,4 +81,13 @@ def test_confluence_url_validator():
                 "JIRA_API_USER": "test@example.com",
             },
         ):
-            Settings()
+            Settings.from_env(env_file=env_file)
+
+
+def test_jira_variables_take_precedence(env_file):
+    """Test that JIRA_* names win over their CONFLUENCE_* fallbacks when both are set."""
+    settings = Settings.from_env(
+        {"JIRA_BASE_URL": "https://jira.atlassian.net", "CONFLUENCE_URL": "https://other.net"},
+        env_file=env_file,
+    )
+    assert settings.JIRA_BASE_URL == "https://jira.atlassian.net"
@@ -0,0 +1,39 @@
+"""Tests for the pagination cursor store."""
+
+from unittest.mock import patch
+
+from src.confluence_mcp.cursor_store import CursorStore
+
+
+def test_put_and_get():
+    """Test that stored pagination state can be looked up by its token."""
+    store = CursorStore()
+    token = store.put("content", "/rest/api/content?start=25", {"limit": 25})
+
+    assert store.get(token) == {
+        "endpoint": "content",
+        "next_link": "/rest/api/content?start=25",
+        "params": {"limit": 25},
+    }
+    assert store.get("unknown") is None
+
+
+def test_cursor_expires():
+    """Test that cursors are dropped once their TTL has passed."""
+    store = CursorStore(ttl=300)
+    with patch("src.confluence_mcp.cursor_store.time.monotonic", return_value=1000.0):
+        token = store.put("content", "/rest/api/content?start=25", {})
+    with patch("src.confluence_mcp.cursor_store.time.monotonic", return_value=1300.0):
+        assert store.get(token) is None
+
+
+def test_oldest_cursor_evicted_when_full():
+    """Test that the store stays bounded by evicting the oldest cursor."""
+    store = CursorStore(maxsize=2)
+    first = store.put("content", "a", {})
+    second = store.put("content", "b", {})
+    third = store.put("content", "c", {})
+
+    assert store.get(first) is None
+    assert store.get(second)["next_link"] == "b"
+    assert store.get(third)["next_link"] == "c"
@@ -0,0 +1,24 @@
+"""Shared fixtures for function tests."""
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from src.confluence_mcp.functions import page, search, space
+
+
+@pytest.fixture(autouse=True)
+def clear_page_versions():
+    """Start every test with an empty page version cache."""
+    page._page_versions.clear()
+    yield
+    page._page_versions.clear()
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    """Make get_client() in every function module return one mock API client."""
+    client = MagicMock()
+    for module in (page, search, space):
+        monkeypatch.setattr(module, "get_client", lambda: client)
+    return client
@@ -1,25 +1,34 @@
 """Tests for page-related MCP implementation functions."""
 
+import asyncio
+
+import orjson
 import pytest
-from unittest.mock import AsyncMock, patch
 
 from src.confluence_mcp.functions.page import (
     list_pages_impl,
+    continue_pagination_impl,
     get_page_impl,
     create_page_impl,
     update_page_impl,
     delete_page_impl,
+    create_pages_impl,
+    update_pages_impl,
+    delete_pages_impl,
 )
+from src.confluence_mcp.models import ConfluenceError
+from tests.conftest import StubCall, StubSeq
+
+# Page listing served over the mock transport, serialized once instead of per request
+PAYLOAD_LIST_PAGES = b'{"results":[{"id":"123","title":"Test Page"}],"size":1,"_links":{}}'
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.page.get_client")
-async def test_list_pages_no_filters(mock_get_client):
+async def test_list_pages_no_filters(mock_client):
     """Test listing pages without filters."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.get = AsyncMock(
-        return_value={
+    mock_client.get = StubCall(
+        {
             "results": [
                 {"id": "123", "title": "Test Page", "spaceId": "SPACE-123", "status": "current"},
                 {"id": "456", "title": "Another Page", "spaceId": "SPACE-123", "status": "current"},
@@ -47,13 +56,11 @@ async def test_list_pages_no_filters(mock_get_client):
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.page.get_client")
-async def test_list_pages_with_filters(mock_get_client):
+async def test_list_pages_with_filters(mock_client):
     """Test listing pages with filters."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.get = AsyncMock(
-        return_value={
+    mock_client.get = StubCall(
+        {
             "results": [
                 {"id": "123", "title": "Test Page", "spaceId": "SPACE-123", "status": "current"}
             ],
@@ -79,13 +86,11 @@ async def test_list_pages_with_filters(mock_get_client):
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.page.get_client")
-async def test_list_pages_fetch_all(mock_get_client):
+async def test_list_pages_fetch_all(mock_client):
     """Test listing pages with fetch_all flag."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.fetch_all_pages = AsyncMock(
-        return_value=[
+    mock_client.fetch_all_pages = StubCall(
+        [
             {"id": "123", "title": "Test Page", "spaceId": "SPACE-123"},
             {"id": "456", "title": "Another Page", "spaceId": "SPACE-123"},
         ]
@@ -107,13 +112,69 @@ async def test_list_pages_fetch_all(mock_get_client):
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.page.get_client")
-async def test_get_page(mock_get_client):
+async def test_list_pages_batched(http_routes):
+    """Test that a total above the page size requests every offset concurrently."""
+    http_routes.add("GET", "/wiki/rest/api/content", json={"results": [{"id": "1"}, {"id": "2"}]})
+
+    result = await list_pages_impl(space_id="SPACE-123", limit=2, total=5)
+
+    # Three pages of two results, trimmed to the requested total
+    assert result["count"] == 5
+    assert len(result["pages"]) == 5
+
+    # Verify one API call per offset, with no probe of the first page
+    starts = sorted(int(request.url.params["start"]) for request in http_routes.requests)
+    assert starts == [0, 2, 4]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("limit", [0, -5])
+async def test_list_pages_rejects_non_positive_limit(mock_client, limit):
+    """Test that a limit below one is rejected before any request is made."""
+    mock_client.get = StubCall({"results": []})
+
+    with pytest.raises(ValueError):
+        await list_pages_impl(space_id="SPACE-123", limit=limit, total=10)
+
+    assert mock_client.get.calls == []
+
+
+@pytest.mark.asyncio
+async def test_list_pages_continue_pagination(mock_client):
+    """Test resuming a listing from the cursor returned with a partial page."""
+    mock_client.get = StubSeq(
+        [
+            {
+                "results": [{"id": "1"}],
+                "size": 1,
+                "_links": {"next": "/rest/api/content?next=true&limit=1&start=1"},
+            },
+            {"results": [{"id": "2"}], "size": 1, "_links": {}},
+        ]
+    )
+
+    first = await list_pages_impl(space_id="SPACE-123", limit=1)
+    second = await continue_pagination_impl(first["next_cursor"])
+
+    # The stored next link is fetched as-is, without re-sending the original filters
+    mock_client.get.assert_called_with("content?next=true&limit=1&start=1")
+    assert second["pages"] == [{"id": "2"}]
+    assert "next_cursor" not in second
+
+
+@pytest.mark.asyncio
+async def test_continue_pagination_unknown_cursor():
+    """Test that an unknown cursor is rejected."""
+    with pytest.raises(ValueError, match="Unknown or expired pagination cursor"):
+        await continue_pagination_impl("missing")
+
+
+@pytest.mark.asyncio
+async def test_get_page(mock_client):
     """Test getting a page by ID."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.get = AsyncMock(
-        return_value={
+    mock_client.get = StubCall(
+        {
             "id": "123",
             "title": "Test Page",
             "spaceId": "SPACE-123",
@@ -137,13 +198,65 @@ async def test_get_page(mock_get_client):
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.page.get_client")
-async def test_create_page(mock_get_client):
+async def test_list_pages_over_http(http_routes):
+    """Test listing pages through the real API client and HTTP request path."""
+    http_routes.add(
+        "GET",
+        "/wiki/rest/api/content",
+        content=PAYLOAD_LIST_PAGES,
+        headers={"Content-Type": "application/json"},
+    )
+
+    result = await list_pages_impl(space_id="SPACE-123")
+
+    assert result["pages"] == [{"id": "123", "title": "Test Page"}]
+    assert result["count"] == 1
+    (request,) = http_routes.requests
+    assert dict(request.url.params) == {"limit": "25", "space-id": "SPACE-123"}
+
+
+@pytest.mark.asyncio
+async def test_get_page_not_found_over_http(http_routes):
+    """Test that an HTTP error from the API surfaces as a ConfluenceError."""
+    with pytest.raises(ConfluenceError) as exc_info:
+        await get_page_impl(id="999")
+
+    assert exc_info.value.status_code == 404
+    assert http_routes.requests[0].url.path == "/wiki/rest/api/content/999"
+
+
+@pytest.mark.asyncio
+async def test_get_page_error_logged_and_reraised(mock_client, caplog):
+    """Test that a failing call is logged with its arguments and re-raised."""
+    mock_client.get = StubCall(raises=ConfluenceError(message="Not found", status_code=404))
+
+    with pytest.raises(ConfluenceError):
+        await get_page_impl(id="123")
+
+    record = caplog.records[-1]
+    assert record.name == "confluence_mcp.functions.page"
+    assert record.getMessage().startswith("Error getting page with arguments {'id': '123'}")
+    assert record.exc_info is not None
+
+
+@pytest.mark.asyncio
+async def test_get_page_bad_arguments_logged(mock_client, caplog):
+    """Test that a call with unknown arguments is still logged with what was passed."""
+    with pytest.raises(TypeError):
+        await get_page_impl(id="1", bogus=2)
+
+    record = caplog.records[-1]
+    assert record.name == "confluence_mcp.functions.page"
+    assert "'kwargs': {'id': '1', 'bogus': 2}" in record.getMessage()
+    assert record.exc_info[0] is TypeError
+
+
+@pytest.mark.asyncio
+async def test_create_page(mock_client):
     """Test creating a new page."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.post = AsyncMock(
-        return_value={"id": "123", "title": "New Page", "spaceId": "SPACE-123", "status": "current"}
+    mock_client.post = StubCall(
+        {"id": "123", "title": "New Page", "spaceId": "SPACE-123", "status": "current"}
     )
 
     # Call the implementation function
@@ -163,14 +276,10 @@ async def test_create_page(mock_get_client):
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.page.get_client")
-async def test_update_page_with_existing_version(mock_get_client):
+async def test_update_page_with_existing_version(mock_client):
     """Test updating a page with provided version."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.put = AsyncMock(
-        return_value={"id": "123", "title": "Updated Page", "version": {"number": 5}}
-    )
+    mock_client.put = StubCall({"id": "123", "title": "Updated Page", "version": {"number": 5}})
 
     # Call the implementation function with explicit version
     body = {"representation": "storage", "value": "<p>Updated content</p>"}
@@ -192,17 +301,11 @@ async def test_update_page_with_existing_version(mock_get_client):
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.page.get_client")
-async def test_update_page_auto_version(mock_get_client):
+async def test_update_page_auto_version(mock_client):
     """Test updating a page with auto-incremented version."""
     # Setup mock responses
-    mock_client = mock_get_client.return_value
-    mock_client.get = AsyncMock(
-        return_value={"id": "123", "title": "Test Page", "version": {"number": 1}}
-    )
-    mock_client.put = AsyncMock(
-        return_value={"id": "123", "title": "Updated Page", "version": {"number": 2}}
-    )
+    mock_client.get = StubCall({"id": "123", "title": "Test Page", "version": {"number": 1}})
+    mock_client.put = StubCall({"id": "123", "title": "Updated Page", "version": {"number": 2}})
 
     # Call the implementation function without version
     result = await update_page_impl(id="123", title="Updated Page")
@@ -226,12 +329,93 @@ async def test_update_page_auto_version(mock_get_client):
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.page.get_client")
-async def test_delete_page(mock_get_client):
+async def test_update_page_uses_cached_version(mock_client):
+    """Test updating a page reuses the version seen by an earlier get."""
+    mock_client.get = StubCall({"id": "123", "title": "Test Page", "version": {"number": 3}})
+    mock_client.put = StubCall({"id": "123", "title": "Updated Page", "version": {"number": 4}})
+
+    await get_page_impl(id="123")
+    await update_page_impl(id="123", title="Updated Page")
+    await update_page_impl(id="123", title="Updated Page")
+
+    # Only the explicit get hits the API; each update increments the cached version
+    mock_client.get.assert_called_once()
+    versions = [c.args[1]["version"]["number"] for c in mock_client.put.call_args_list]
+    assert versions == [4, 5]
+
+
+@pytest.mark.asyncio
+async def test_update_page_stale_cached_version(mock_client):
+    """Test a version conflict on a cached version refetches the page and retries once."""
+    mock_client.get = StubCall({"id": "123", "title": "Test Page", "version": {"number": 7}})
+    mock_client.put = StubSeq(
+        [
+            {"id": "123", "title": "Updated Page", "version": {"number": 2}},
+            ConfluenceError(message="Version conflict", status_code=409),
+            {"id": "123", "title": "Updated Page", "version": {"number": 8}},
+        ]
+    )
+
+    await update_page_impl(id="123", title="Updated Page", version={"number": 2})
+    result = await update_page_impl(id="123", title="Updated Page")
+
+    assert result["page"]["version"]["number"] == 8
+    mock_client.get.assert_called_once_with("content/123")
+    versions = [c.args[1]["version"]["number"] for c in mock_client.put.call_args_list]
+    assert versions == [2, 3, 8]
+
+
+@pytest.mark.asyncio
+async def test_update_page_stale_fetched_version(mock_client):
+    """Test a version conflict on a freshly fetched version also refetches and retries."""
+    mock_client.get = StubSeq(
+        [
+            {"id": "123", "title": "Test Page", "version": {"number": 4}},
+            {"id": "123", "title": "Test Page", "version": {"number": 5}},
+        ]
+    )
+    mock_client.put = StubSeq(
+        [
+            ConfluenceError(message="Version conflict", status_code=412),
+            {"id": "123", "title": "Updated Page", "version": {"number": 6}},
+        ]
+    )
+
+    result = await update_page_impl(id="123", title="Updated Page")
+
+    assert result["page"]["version"]["number"] == 6
+    versions = [c.args[1]["version"]["number"] for c in mock_client.put.call_args_list]
+    assert versions == [5, 6]
+
+
+@pytest.mark.asyncio
+async def test_update_page_version_probe_bypasses_cache(http_routes, api_client):
+    """Test that the version probe is not answered from a stale cached GET."""
+    http_routes.add(
+        "GET", "/wiki/rest/api/content/123", json={"id": "123", "version": {"number": 1}}
+    )
+    await api_client.get("content/123")
+
+    # The page is edited elsewhere after the GET was cached
+    http_routes.add(
+        "GET", "/wiki/rest/api/content/123", json={"id": "123", "version": {"number": 5}}
+    )
+    http_routes.add(
+        "PUT", "/wiki/rest/api/content/123", json={"id": "123", "version": {"number": 6}}
+    )
+
+    await update_page_impl(id="123", title="Updated Page")
+
+    put = http_routes.requests[-1]
+    assert put.method == "PUT"
+    assert orjson.loads(put.content)["version"]["number"] == 6
+
+
+@pytest.mark.asyncio
+async def test_delete_page(mock_client):
     """Test deleting a page."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.delete = AsyncMock(return_value={})
+    mock_client.delete = StubCall({})
 
     # Call the implementation function
     result = await delete_page_impl(id="123")
@@ -245,3 +429,87 @@ async def test_delete_page(mock_get_client):
 
     # Verify API call
     mock_client.delete.assert_called_once_with("content/123")
+
+
+@pytest.mark.asyncio
+async def test_create_pages_batch(mock_client):
+    """Test creating several pages reports a result per item."""
+    mock_client.post = StubSeq(
+        [
+            {"id": "1", "title": "First"},
+            ConfluenceError(message="Title already exists", status_code=400),
+        ]
+    )
+
+    body = {"representation": "storage", "value": "<p>Content</p>"}
+    result = await create_pages_impl(
+        items=[
+            {"space_id": "SPACE-123", "title": "First", "body": body},
+            {"space_id": "SPACE-123", "title": "Second", "body": body},
+            {"title": "Missing space"},
+        ],
+        concurrency=1,
+    )
+
+    # One failure does not abort the rest of the batch
+    assert result["count"] == 3
+    assert result["failed"] == 2
+    assert result["results"][0] == {
+        "success": True,
+        "result": {
+            "page": {"id": "1", "title": "First"},
+            "message": "Page 'First' created successfully",
+        },
+    }
+    assert result["results"][1]["success"] is False
+    assert "Title already exists" in result["results"][1]["error"]
+    assert result["results"][2]["success"] is False
+    assert mock_client.post.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_update_pages_batch(mock_client):
+    """Test updating several pages concurrently."""
+    mock_client.put = StubCall({"id": "123", "title": "Updated Page"})
+
+    version = {"number": 2, "message": "Batch update"}
+    result = await update_pages_impl(
+        items=[
+            {"id": "123", "title": "Updated Page", "version": version},
+            {"id": "456", "title": "Updated Page", "version": version},
+        ]
+    )
+
+    assert result["count"] == 2
+    assert result["failed"] == 0
+    assert mock_client.put.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_delete_pages_batch(mock_client):
+    """Test deleting several pages returns results in input order."""
+    mock_client.delete = StubCall({})
+
+    result = await delete_pages_impl(ids=["123", "456"])
+
+    assert [r["result"]["id"] for r in result["results"]] == ["123", "456"]
+    assert result["failed"] == 0
+    assert result["message"] == "Deleted 2 of 2 pages"
+
+
+@pytest.mark.asyncio
+async def test_delete_pages_cancelled_item_reported_as_failure(mock_client):
+    """Test that an operation cancelled mid-batch is not reported as a success."""
+
+    async def delete(path):
+        if path == "content/456":
+            raise asyncio.CancelledError()
+        return {}
+
+    mock_client.delete = StubCall(handler=delete)
+
+    result = await delete_pages_impl(ids=["123", "456"])
+
+    assert [r["success"] for r in result["results"]] == [True, False]
+    assert result["results"][1]["error"] == "CancelledError"
+    assert result["failed"] == 1
@@ -1,7 +1,6 @@
 """Tests for page-related MCP implementation functions."""
 
 import pytest
-from unittest.mock import AsyncMock, patch
 
 from src.confluence_mcp.functions.page import (
     list_pages_impl,
@@ -10,16 +9,15 @@ from src.confluence_mcp.functions.page import (
     update_page_impl,
     delete_page_impl,
 )
+from tests.conftest import StubCall
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.page.get_client")
-async def test_list_pages_no_filters(mock_get_client):
+async def test_list_pages_no_filters(mock_client):
     """Test listing pages without filters."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.get = AsyncMock(
-        return_value={
+    mock_client.get = StubCall(
+        {
             "results": [
                 {"id": "123", "title": "Test Page", "spaceId": "SPACE-123", "status": "current"},
                 {"id": "456", "title": "Another Page", "spaceId": "SPACE-123", "status": "current"},
@@ -47,13 +45,11 @@ async def test_list_pages_no_filters(mock_get_client):
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.page.get_client")
-async def test_list_pages_with_filters(mock_get_client):
+async def test_list_pages_with_filters(mock_client):
     """Test listing pages with filters."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.get = AsyncMock(
-        return_value={
+    mock_client.get = StubCall(
+        {
             "results": [
                 {"id": "123", "title": "Test Page", "spaceId": "SPACE-123", "status": "current"}
             ],
@@ -79,13 +75,11 @@ async def test_list_pages_with_filters(mock_get_client):
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.page.get_client")
-async def test_list_pages_fetch_all(mock_get_client):
+async def test_list_pages_fetch_all(mock_client):
     """Test listing pages with fetch_all flag."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.fetch_all_pages = AsyncMock(
-        return_value=[
+    mock_client.fetch_all_pages = StubCall(
+        [
             {"id": "123", "title": "Test Page", "spaceId": "SPACE-123"},
             {"id": "456", "title": "Another Page", "spaceId": "SPACE-123"},
         ]
@@ -107,13 +101,11 @@ async def test_list_pages_fetch_all(mock_get_client):
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.page.get_client")
-async def test_get_page(mock_get_client):
+async def test_get_page(mock_client):
     """Test getting a page by ID."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.get = AsyncMock(
-        return_value={
+    mock_client.get = StubCall(
+        {
             "id": "123",
             "title": "Test Page",
             "spaceId": "SPACE-123",
@@ -137,13 +129,11 @@ async def test_get_page(mock_get_client):
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.page.get_client")
-async def test_create_page(mock_get_client):
+async def test_create_page(mock_client):
     """Test creating a new page."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.post = AsyncMock(
-        return_value={"id": "123", "title": "New Page", "spaceId": "SPACE-123", "status": "current"}
+    mock_client.post = StubCall(
+        {"id": "123", "title": "New Page", "spaceId": "SPACE-123", "status": "current"}
     )
 
     # Call the implementation function
@@ -163,14 +153,10 @@ async def test_create_page(mock_get_client):
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.page.get_client")
-async def test_update_page_with_existing_version(mock_get_client):
+async def test_update_page_with_existing_version(mock_client):
     """Test updating a page with provided version."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.put = AsyncMock(
-        return_value={"id": "123", "title": "Updated Page", "version": {"number": 5}}
-    )
+    mock_client.put = StubCall({"id": "123", "title": "Updated Page", "version": {"number": 5}})
 
     # Call the implementation function with explicit version
     body = {"representation": "storage", "value": "<p>Updated content</p>"}
@@ -192,17 +178,11 @@ async def test_update_page_with_existing_version(mock_get_client):
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.page.get_client")
-async def test_update_page_auto_version(mock_get_client):
+async def test_update_page_auto_version(mock_client):
     """Test updating a page with auto-incremented version."""
     # Setup mock responses
-    mock_client = mock_get_client.return_value
-    mock_client.get = AsyncMock(
-        return_value={"id": "123", "title": "Test Page", "version": {"number": 1}}
-    )
-    mock_client.put = AsyncMock(
-        return_value={"id": "123", "title": "Updated Page", "version": {"number": 2}}
-    )
+    mock_client.get = StubCall({"id": "123", "title": "Test Page", "version": {"number": 1}})
+    mock_client.put = StubCall({"id": "123", "title": "Updated Page", "version": {"number": 2}})
 
     # Call the implementation function without version
     result = await update_page_impl(id="123", title="Updated Page")
@@ -226,12 +206,10 @@ async def test_update_page_auto_version(mock_get_client):
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.page.get_client")
-async def test_delete_page(mock_get_client):
+async def test_delete_page(mock_client):
     """Test deleting a page."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.delete = AsyncMock(return_value={})
+    mock_client.delete = StubCall({})
 
     # Call the implementation function
     result = await delete_page_impl(id="123")
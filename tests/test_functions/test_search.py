@@ -1,122 +1,72 @@
 """Tests for search-related MCP implementation functions."""
 
 import pytest
-from unittest.mock import AsyncMock, patch
 
 from src.confluence_mcp.functions.search import (
     search_content_impl,
     advanced_search_impl,
     _build_cql_query,
 )
+from tests.conftest import StubCall
 
+# Expected CQL for the query "test", on its own and restricted to pages of one space
+CQL_BASIC = 'text ~ "test"'
+CQL_SPACE_PAGE = 'text ~ "test" AND space.id = SPACE-123 AND type = page'
 
-@pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.search.get_client")
-async def test_search_content_basic(mock_get_client):
-    """Test basic content search."""
-    # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.get = AsyncMock(
-        return_value={
-            "results": [
-                {
-                    "content": {
-                        "id": "123",
-                        "title": "Test Page",
-                        "type": "page",
-                        "space": {"id": "SPACE-123"},
-                    },
-                    "title": "Test Page",
-                    "excerpt": "This is a <b>test</b> page...",
-                },
-                {
-                    "content": {
-                        "id": "456",
-                        "title": "Another Page",
-                        "type": "page",
-                        "space": {"id": "SPACE-123"},
-                    },
-                    "title": "Another Page",
-                    "excerpt": "This is <b>another</b> test page...",
-                },
-            ],
-            "totalSize": 2,
-        }
-    )
 
-    # Call the implementation function directly
-    result = await search_content_impl(query="test")
-
-    # Verify the result
-    assert "results" in result
-    assert len(result["results"]) == 2
-    assert result["results"][0]["content"]["id"] == "123"
-    assert result["results"][1]["content"]["id"] == "456"
-    assert result["count"] == 2
-    assert result["total"] == 2
-    assert "message" in result
-
-    # Verify API call
-    mock_client.get.assert_called_once_with(
-        "search", {"cql": 'text ~ "test"', "limit": 25}
-    )
+def _search_result(id: str, title: str) -> dict:
+    """Build a search result entry as returned by the search endpoint."""
+    return {
+        "content": {"id": id, "title": title, "type": "page", "space": {"id": "SPACE-123"}},
+        "title": title,
+        "excerpt": f"This is <b>{title}</b>...",
+    }
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.search.get_client")
-async def test_search_content_with_filters(mock_get_client):
-    """Test content search with filters."""
+@pytest.mark.parametrize(
+    "filters,expected_cql,expected_limit,results",
+    [
+        (
+            {},
+            CQL_BASIC,
+            25,
+            [_search_result("123", "Test Page"), _search_result("456", "Another Page")],
+        ),
+        (
+            {"space_id": "SPACE-123", "content_type": "page", "limit": 10},
+            CQL_SPACE_PAGE,
+            10,
+            [_search_result("123", "Test Page")],
+        ),
+    ],
+)
+async def test_search_content(mock_client, filters, expected_cql, expected_limit, results):
+    """Test content search with and without filters."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.get = AsyncMock(
-        return_value={
-            "results": [
-                {
-                    "content": {
-                        "id": "123",
-                        "title": "Test Page",
-                        "type": "page",
-                        "space": {"id": "SPACE-123"},
-                    },
-                    "title": "Test Page",
-                    "excerpt": "This is a <b>test</b> page...",
-                }
-            ],
-            "totalSize": 1,
-        }
-    )
+    mock_client.get = StubCall({"results": results, "totalSize": len(results)})
 
-    # Call the implementation function with filters
-    result = await search_content_impl(
-        query="test", space_id="SPACE-123", content_type="page", limit=10
-    )
+    # Call the implementation function directly
+    result = await search_content_impl(query="test", **filters)
 
     # Verify the result
-    assert "results" in result
-    assert len(result["results"]) == 1
-    assert result["results"][0]["content"]["id"] == "123"
-    assert result["count"] == 1
-    assert result["total"] == 1
+    assert [r["content"]["id"] for r in result["results"]] == [r["content"]["id"] for r in results]
+    assert result["count"] == len(results)
+    assert result["total"] == len(results)
     assert "message" in result
 
     # Verify API call
     mock_client.get.assert_called_once_with(
-        "search",
-        {
-            "cql": 'text ~ "test" AND space.id = SPACE-123 AND type = page',
-            "limit": 10,
-        },
+        "search", {"cql": expected_cql, "limit": expected_limit}
     )
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.search.get_client")
-async def test_search_content_fetch_all(mock_get_client):
+async def test_search_content_fetch_all(mock_client):
     """Test content search with fetch_all flag."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.fetch_all_pages = AsyncMock(
-        return_value=[
+    mock_client.fetch_all_pages = StubCall(
+        [
             {"content": {"id": "123", "title": "Test Page", "type": "page"}},
             {"content": {"id": "456", "title": "Another Page", "type": "page"}},
         ]
@@ -132,19 +82,15 @@ async def test_search_content_fetch_all(mock_get_client):
     assert "message" in result
 
     # Verify API call
-    mock_client.fetch_all_pages.assert_called_once_with(
-        "search", {"cql": 'text ~ "test"', "limit": 25}
-    )
+    mock_client.fetch_all_pages.assert_called_once_with("search", {"cql": CQL_BASIC, "limit": 25})
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.search.get_client")
-async def test_advanced_search(mock_get_client):
+async def test_advanced_search(mock_client):
     """Test advanced search with custom CQL."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.get = AsyncMock(
-        return_value={
+    mock_client.get = StubCall(
+        {
             "results": [{"content": {"id": "123", "title": "Test Page", "type": "page"}}],
             "totalSize": 1,
         }
@@ -166,24 +112,56 @@ async def test_advanced_search(mock_get_client):
     )
 
 
-def test_build_cql_query_basic():
-    """Test basic CQL query building."""
-    query = _build_cql_query("test")
-    assert query == 'text ~ "test"'
-
-
-def test_build_cql_query_with_filters():
-    """Test CQL query building with multiple filters."""
-    query = _build_cql_query(
-        query="test",
-        space_id="SPACE-123",
-        content_type="page",
-        created_after="2023-01-01",
-        updated_before="2023-12-31",
-        creator="johndoe",
-    )
-    assert query == (
-        'text ~ "test" AND space.id = SPACE-123 AND type = page AND '
-        'created >= "2023-01-01" AND '
-        'lastmodified <= "2023-12-31" AND creator = "johndoe"'
-    )
+@pytest.mark.parametrize(
+    "kwargs,expected",
+    [
+        pytest.param({"query": "test"}, CQL_BASIC, id="basic"),
+        pytest.param(
+            {
+                "query": "test",
+                "space_id": "SPACE-123",
+                "content_type": "page",
+                "created_after": "2023-01-01",
+                "updated_before": "2023-12-31",
+                "creator": "johndoe",
+            },
+            'text ~ "test" AND space.id = SPACE-123 AND type = page AND '
+            'created >= "2023-01-01" AND lastmodified <= "2023-12-31" AND creator = "johndoe"',
+            id="filters",
+        ),
+        pytest.param(
+            {
+                "query": "test",
+                "created_after": "2023-01-01",
+                "created_before": "2023-12-31",
+                "updated_after": "2023-06-01",
+                "updated_before": "2023-06-30",
+            },
+            'text ~ "test" AND created >= "2023-01-01" AND created <= "2023-12-31" AND '
+            'lastmodified >= "2023-06-01" AND lastmodified <= "2023-06-30"',
+            id="date-filters",
+        ),
+        pytest.param(
+            {"query": "test", "creator": "admin", "contributor": "user123"},
+            'text ~ "test" AND creator = "admin" AND contributor = "user123"',
+            id="user-filters",
+        ),
+        # Archived content is not filtered out, since Confluence does not support the filter
+        pytest.param({"query": "test", "include_archived": True}, CQL_BASIC, id="archived"),
+        pytest.param(
+            {"query": 'test with "quotes"'}, 'text ~ "test with \\"quotes\\""', id="escapes-quotes"
+        ),
+        pytest.param(
+            {"query": "  pages   about\tauth "}, 'text ~ "pages about auth"', id="whitespace"
+        ),
+        # Braces in values are not treated as template fields
+        pytest.param(
+            {"query": "{config}", "creator": "{user}"},
+            'text ~ "{config}" AND creator = "{user}"',
+            id="literal-braces",
+        ),
+    ],
+)
+def test_build_cql_query(kwargs, expected):
+    """Test CQL query building."""
+    assert _build_cql_query(**kwargs) == expected
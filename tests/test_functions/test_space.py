@@ -1,111 +1,79 @@
 """Tests for space-related MCP functions."""
 
 import pytest
-from unittest.mock import AsyncMock, patch
 
 from src.confluence_mcp.functions.space import list_spaces_impl, get_space_impl
+from tests.conftest import StubCall
 
 
-@pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.space.get_client")
-async def test_list_spaces_no_filters(mock_get_client):
-    """Test listing spaces without filters."""
-    # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.get = AsyncMock(
-        return_value={
-            "results": [
-                {
-                    "id": "123",
-                    "key": "TEST",
-                    "name": "Test Space",
-                    "type": "global",
-                    "status": "current",
-                    "description": {"plain": {"value": "Test description"}},
-                },
-                {
-                    "id": "456",
-                    "key": "DEV",
-                    "name": "Development Space",
-                    "type": "global",
-                    "status": "current",
-                },
-            ]
-        }
-    )
+def _space(id: str, key: str, name: str, **extra) -> dict:
+    """Build a space entry as returned by the spaces endpoint."""
+    return {"id": id, "key": key, "name": name, "type": "global", "status": "current", **extra}
 
-    # Call the function
-    result = await list_spaces_impl()
 
-    # Verify the result
-    assert "spaces" in result
-    assert len(result["spaces"]) == 2
-    assert result["spaces"][0]["id"] == "123"
-    assert result["spaces"][0]["key"] == "TEST"
-    assert result["spaces"][1]["id"] == "456"
-    assert result["spaces"][1]["key"] == "DEV"
+# Space entry as returned by both the list and get endpoints; the functions never mutate it
+TEST_SPACE = _space(
+    "123", "TEST", "Test Space", description={"plain": {"value": "Test description"}}
+)
 
-    # Verify API call
-    mock_client.get.assert_called_once_with("spaces", {"limit": 25})
+# (list_spaces_impl kwargs, expected query params, spaces returned by the API)
+LIST_CASES = [
+    pytest.param(
+        {},
+        {"limit": 25},
+        [TEST_SPACE, _space("456", "DEV", "Development Space")],
+        id="no-filters",
+    ),
+    pytest.param(
+        {"keys": ["TEST"], "status": "current", "type": "global", "limit": 10},
+        {"limit": 10, "keys": "TEST", "status": "current", "type": "global"},
+        [_space("123", "TEST", "Test Space")],
+        id="filters",
+    ),
+]
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.space.get_client")
-async def test_list_spaces_with_filters(mock_get_client):
-    """Test listing spaces with filters."""
+@pytest.mark.parametrize("kwargs,expected_params,spaces", LIST_CASES)
+async def test_list_spaces(mock_client, kwargs, expected_params, spaces):
+    """Test listing spaces with and without filters."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.get = AsyncMock(
-        return_value={
-            "results": [
-                {
-                    "id": "123",
-                    "key": "TEST",
-                    "name": "Test Space",
-                    "type": "global",
-                    "status": "current",
-                }
-            ]
-        }
-    )
-
-    # Call the function with filters
-    result = await list_spaces_impl(keys=["TEST"], status="current", type="global", limit=10)
+    mock_client.get = StubCall({"results": spaces})
+
+    # Call the function
+    result = await list_spaces_impl(**kwargs)
 
     # Verify the result
-    assert result is not None
-    assert len(result["spaces"]) == 1
-    assert result["spaces"][0]["key"] == "TEST"
+    assert [(s["id"], s["key"]) for s in result["spaces"]] == [(s["id"], s["key"]) for s in spaces]
 
     # Verify API call
-    mock_client.get.assert_called_once_with(
-        "spaces", {"limit": 10, "keys": "TEST", "status": "current", "type": "global"}
-    )
+    mock_client.get.assert_called_once_with("spaces", expected_params)
 
 
 @pytest.mark.asyncio
-@patch("src.confluence_mcp.functions.space.get_client")
-async def test_get_space_by_id(mock_get_client):
+async def test_get_space_by_id(mock_client):
     """Test getting a space by ID."""
     # Setup mock response
-    mock_client = mock_get_client.return_value
-    mock_client.get = AsyncMock(
-        return_value={
-            "id": "123",
-            "key": "TEST",
-            "name": "Test Space",
-            "type": "global",
-            "status": "current",
-            "description": {"plain": {"value": "Test description"}},
-        }
-    )
+    mock_client.get = StubCall(TEST_SPACE)
 
     # Call the function
     result = await get_space_impl(id="123")
+
     # Verify the result
-    assert "space" in result
-    assert result["space"]["id"] == "123"
-    assert result["space"]["key"] == "TEST"
-    assert result["space"]["name"] == "Test Space"
+    space = result["space"]
+    assert (space["id"], space["key"], space["name"]) == ("123", "TEST", "Test Space")
+
     # Verify API call
     mock_client.get.assert_called_once_with("spaces/123")
+
+
+@pytest.mark.asyncio
+async def test_get_space_served_from_cache(http_routes):
+    """Test that fetching the same space twice only reaches the API once."""
+    http_routes.add("GET", "/wiki/rest/api/spaces/123", json=TEST_SPACE)
+
+    first = await get_space_impl(id="123")
+    second = await get_space_impl(id="123")
+
+    assert first["space"] == second["space"] == TEST_SPACE
+    assert len(http_routes.requests) == 1
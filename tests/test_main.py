@@ -0,0 +1,30 @@
+"""Tests for the server entry point."""
+
+import logging
+
+import orjson
+
+from src.confluence_mcp.main import JsonFormatter
+
+
+def test_json_formatter():
+    """Test that log records are serialized as JSON with their extra fields."""
+    logger = logging.getLogger("confluence_mcp.test")
+    record = logger.makeRecord(
+        logger.name,
+        logging.INFO,
+        __file__,
+        1,
+        "Listing pages in %s",
+        ("SPACE-123",),
+        None,
+        extra={"params": {"limit": 25}},
+    )
+
+    payload = orjson.loads(JsonFormatter().format(record))
+
+    assert payload["message"] == "Listing pages in SPACE-123"
+    assert payload["level"] == "INFO"
+    assert payload["name"] == "confluence_mcp.test"
+    assert payload["params"] == {"limit": 25}
+    assert "args" not in payload